@@ -8,6 +8,7 @@ from contextvars import ContextVar
 from typing import Optional, Any, Callable, Dict, List
 from pathlib import Path
 from datetime import datetime
+import threading
 
 from failcore.core.types.step import Step, RunContext, generate_run_id
 from ..core.executor.executor import Executor, ExecutorConfig
@@ -32,7 +33,8 @@ CURRENT_RUN_CONTEXT: ContextVar[Optional["RunCtx"]] = ContextVar(
 # This is created once and reused across runs for performance.
 # Core layer (ValidationEngine) only accepts explicit registry injection.
 _APP_REGISTRY: Optional["ValidatorRegistry"] = None
-_APP_REGISTRY_LOCK = None
+_APP_REGISTRY_LOCK = threading.Lock()
+
 
 def _get_app_registry() -> "ValidatorRegistry":
     """
@@ -44,21 +46,24 @@ def _get_app_registry() -> "ValidatorRegistry":
     Returns:
         Application-level ValidatorRegistry instance
     """
-    global _APP_REGISTRY, _APP_REGISTRY_LOCK
+    global _APP_REGISTRY
+    
+    # Fast path: a single global read once initialized
+    registry = _APP_REGISTRY
+    if registry is not None:
+        return registry
     
-    if _APP_REGISTRY is None:
-        import threading
-        if _APP_REGISTRY_LOCK is None:
-            _APP_REGISTRY_LOCK = threading.Lock()
-        
-        with _APP_REGISTRY_LOCK:
-            if _APP_REGISTRY is None:
-                from ..core.validate.registry import ValidatorRegistry
-                from ..core.validate.bootstrap import register_builtin_validators
-                
-                _APP_REGISTRY = ValidatorRegistry()
-                register_builtin_validators(_APP_REGISTRY)
-                # Note: Plugins can be loaded here if needed
+    with _APP_REGISTRY_LOCK:
+        if _APP_REGISTRY is None:
+            from ..core.validate.registry import ValidatorRegistry
+            from ..core.validate.bootstrap import register_builtin_validators
+            
+            # Publish only after registration so the fast path never sees
+            # a partially populated registry
+            registry = ValidatorRegistry()
+            register_builtin_validators(registry)
+            # Note: Plugins can be loaded here if needed
+            _APP_REGISTRY = registry
     
     return _APP_REGISTRY
 
@@ -342,7 +347,8 @@ class RunCtx:
         preset_policy = get_preset(preset_name)
         
         if preset_policy:
-            # Return a copy to avoid modifying the preset
+            # get_preset() hands out a shared instance: copy it per run so
+            # nothing downstream can modify the cached preset
             return preset_policy.model_copy(deep=True)
         
         return None
@@ -95,10 +95,10 @@ def list_runs(args):
             
             # Get tools used in this run
             cursor.execute("""
-                SELECT DISTINCT tool
+                SELECT DISTINCT name AS tool
                 FROM steps
                 WHERE run_id = ?
-                ORDER BY tool
+                ORDER BY name
             """, (run_id,))
             
             tools = [row['tool'] for row in cursor.fetchall()]
@@ -101,11 +101,14 @@ def _show_run_summary(store: SQLiteStore, run_id: str, show_steps: bool, show_er
         where_clause += " AND status IN ('BLOCKED', 'FAIL')"
     
     cursor.execute(f"""
-        SELECT step_id, tool, status, phase, duration_ms, error_code, error_message,
-               has_policy_denied, has_output_normalized
+        SELECT step_id, name AS tool, status,
+               json_extract(payload_json, '$.phase') AS phase,
+               duration_ms, error_code, error_message,
+               json_extract(payload_json, '$.has_policy_denied') AS has_policy_denied,
+               json_extract(payload_json, '$.has_output_normalized') AS has_output_normalized
         FROM steps
         {where_clause}
-        ORDER BY start_ts
+        ORDER BY started_at
     """, params)
     
     steps = cursor.fetchall()
@@ -178,7 +181,12 @@ def _show_step_detail(store: SQLiteStore, run_id: str, step_id: str, verbose: bo
     
     # Get step
     cursor.execute("""
-        SELECT * FROM steps
+        SELECT *, name AS tool, started_at AS start_ts, finished_at AS end_ts,
+               fingerprint AS fingerprint_id,
+               json_extract(payload_json, '$.phase') AS phase,
+               json_extract(payload_json, '$.has_policy_denied') AS has_policy_denied,
+               json_extract(payload_json, '$.has_output_normalized') AS has_output_normalized
+        FROM steps
         WHERE run_id = ? AND step_id = ?
     """, (run_id, step_id))
     
@@ -232,7 +240,7 @@ def _show_step_detail(store: SQLiteStore, run_id: str, step_id: str, verbose: bo
     # Get related events if verbose
     if verbose:
         cursor.execute("""
-            SELECT seq, ts, type, level
+            SELECT seq, ts, type, severity AS level
             FROM events
             WHERE run_id = ? AND step_id = ?
             ORDER BY seq
@@ -13,6 +13,7 @@ Production users can opt-in when needed
 
 import subprocess
 import json
+import os
 import sys
 from typing import Any, Dict, Optional
 from pathlib import Path
@@ -81,8 +82,6 @@ class ProcessExecutor:
             "run_id": run_id,
         }
         
-        import os
-        
         # Build subprocess environment (whitelist only + minimal essentials)
         env = {}
         
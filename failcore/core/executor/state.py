@@ -31,7 +31,7 @@ if TYPE_CHECKING:
     from ..validate import ValidationEngine
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionState:
     """
     Execution context state passed between stages
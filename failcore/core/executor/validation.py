@@ -15,7 +15,7 @@ from failcore.core.types.step import RunContext
 from ..validate.contracts import Context as ValidationContext
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationFailure:
     """Validation failure information"""
     code: str
@@ -8,11 +8,11 @@ Gate/Enricher should call scan_dlp(), not directly access DLP internals.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import json
 
 from ..cache import ScanCache, ScannerID, ScanResult
-from failcore.core.rules import RuleRegistry, RuleEngine, RuleCategory, RuleSeverity, RuleAction
+from failcore.core.rules import RuleRegistry, RuleEngine, RuleCategory, RuleSeverity, RuleAction, Rule
 
 
 def scan_dlp(
@@ -64,22 +64,31 @@ def scan_dlp(
     # Rule engine expects tool_name and params
     tool_params = _payload_to_tool_params(payload_str)
     
-    # Evaluate using rule engine
-    result = engine.evaluate(
-        tool_name="__dlp_scan__",
-        params=tool_params,
-        context=context,
-        categories=[
-            RuleCategory.DLP_API_KEY,
-            RuleCategory.DLP_SECRET,
-            RuleCategory.DLP_PII,
-            RuleCategory.DLP_PAYMENT,
-        ],
-    )
+    all_rules = rule_registry.get_rules_by_category(RuleCategory.DLP_API_KEY)
+    all_rules.extend(rule_registry.get_rules_by_category(RuleCategory.DLP_SECRET))
+    all_rules.extend(rule_registry.get_rules_by_category(RuleCategory.DLP_PII))
+    all_rules.extend(rule_registry.get_rules_by_category(RuleCategory.DLP_PAYMENT))
+    
+    # Evaluate using rule engine, unless the combined DLP regex rules out any match
+    if _prefilter_rejects(rule_registry, all_rules, tool_params):
+        rule_matches = []
+    else:
+        result = engine.evaluate(
+            tool_name="__dlp_scan__",
+            params=tool_params,
+            context=context,
+            categories=[
+                RuleCategory.DLP_API_KEY,
+                RuleCategory.DLP_SECRET,
+                RuleCategory.DLP_PII,
+                RuleCategory.DLP_PAYMENT,
+            ],
+        )
+        rule_matches = result.matches
     
     # Convert rule matches to scan results format
     matches = []
-    for match in result.matches:
+    for match in rule_matches:
         # Extract matched text from pattern
         matched_text = _extract_matched_text(payload_str, match.rule)
         
@@ -106,11 +115,6 @@ def scan_dlp(
     }
     
     # Build evidence
-    all_rules = rule_registry.get_rules_by_category(RuleCategory.DLP_API_KEY)
-    all_rules.extend(rule_registry.get_rules_by_category(RuleCategory.DLP_SECRET))
-    all_rules.extend(rule_registry.get_rules_by_category(RuleCategory.DLP_PII))
-    all_rules.extend(rule_registry.get_rules_by_category(RuleCategory.DLP_PAYMENT))
-    
     evidence = {
         "scanner": "dlp",
         "patterns_checked": len(all_rules),
@@ -157,6 +161,25 @@ def _get_default_dlp_registry() -> RuleRegistry:
     return registry
 
 
+def _prefilter_rejects(rule_registry: RuleRegistry, rules: List[Rule], tool_params: Dict[str, Any]) -> bool:
+    """
+    True if the dlp ruleset's combined regex proves no DLP rule can match.
+    
+    Only applies when every DLP rule in the registry comes from that ruleset;
+    otherwise the rules are evaluated one by one as usual.
+    """
+    if not rules:
+        return False
+    ruleset = rule_registry.get_ruleset("dlp")
+    if ruleset is None or ruleset.compiled_db is None:
+        return False
+    loaded = {id(r) for r in ruleset.rules}
+    if any(id(r) not in loaded for r in rules):
+        return False
+    # Same text Rule.check() matches patterns against
+    return not ruleset.may_match(rules[0]._params_to_text(tool_params))
+
+
 def _payload_to_tool_params(payload_str: str) -> Dict[str, Any]:
     """Convert payload string to tool params format"""
     # Try to parse as JSON first
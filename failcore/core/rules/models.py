@@ -180,6 +180,55 @@ class Rule:
             return str(params)
 
 
+# re flags that can be expressed as scoped inline flags, e.g. (?i:...)
+_INLINE_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+# Numbered/named backreferences break when patterns are joined
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _compile_union(rules: List[Rule]) -> Optional[re.Pattern]:
+    """
+    Join every regex pattern of the rules into one alternation.
+    
+    Returns None when the union can't stand in for the individual rules:
+    a rule uses a detector or a non-regex pattern, a pattern uses flags
+    with no inline form or backreferences, or the joined regex fails to
+    compile.
+    """
+    parts = []
+    for rule in rules:
+        if rule.detector is not None:
+            return None
+        for pattern in rule.patterns:
+            if pattern.pattern_type != "regex" or not isinstance(pattern.value, str):
+                return None
+            if pattern.compiled is None:
+                continue  # invalid regex, never matches
+            flags = pattern.flags & ~re.UNICODE
+            inline = ""
+            for flag, letter in _INLINE_FLAGS:
+                if flags & flag:
+                    inline += letter
+                    flags &= ~flag
+            if flags or _BACKREF_RE.search(pattern.value):
+                return None
+            if inline:
+                parts.append(f"(?{inline}:{pattern.value})")
+            else:
+                parts.append(f"(?:{pattern.value})")
+    if not parts:
+        return None
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
+
+
 @dataclass
 class RuleSet:
     """
@@ -192,6 +241,25 @@ class RuleSet:
     description: str
     rules: List[Rule]
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Union of all rule regexes, built at load time (None if not possible).
+    # One search() decides whether any rule here can match text at all.
+    compiled_db: Optional[re.Pattern] = field(default=None, repr=False)
+    
+    def __post_init__(self):
+        """Compile the combined regex of all rules"""
+        if self.compiled_db is None:
+            self.compiled_db = _compile_union(self.rules)
+    
+    def may_match(self, text: str) -> bool:
+        """
+        Cheap pre-check: False means no rule in this set matches text.
+        
+        Only valid for rules as loaded; patterns added afterwards are not
+        part of compiled_db.
+        """
+        if self.compiled_db is None:
+            return True
+        return self.compiled_db.search(text) is not None
     
     def get_rule(self, rule_id: str) -> Optional[Rule]:
         """Get rule by ID"""
@@ -7,6 +7,7 @@ EventWriter - low-level unified trace writer that enforces v0.1.3 envelope forma
 
 from __future__ import annotations
 import json
+import os
 import threading
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
@@ -492,8 +493,6 @@ class EventWriter:
         6. Limit tool_output size (controllable via env var)
         7. Standardize usage fields (keep only canonical names)
         """
-        import os
-        
         cleaned = {}
         evidence = data.get('evidence', {})
         
@@ -516,9 +515,6 @@ class EventWriter:
     
     def _clean_evidence(self, evidence: Dict[str, Any]) -> Dict[str, Any]:
         """Clean evidence fields"""
-        import os
-        import json
-        
         cleaned = {}
         
         # Check if full body capture is enabled
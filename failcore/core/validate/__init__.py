@@ -77,6 +77,7 @@ from .bootstrap import (
 from .plugins import (
     load_plugins,
     discover_plugin_validators,
+    invalidate_plugin_cache,
     is_plugin_system_available,
 )
 
@@ -134,6 +135,7 @@ __all__ = [
     "reset_auto_register_flag",
     "load_plugins",
     "discover_plugin_validators",
+    "invalidate_plugin_cache",
     "is_plugin_system_available",
 ]
 
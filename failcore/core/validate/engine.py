@@ -17,7 +17,7 @@ It only orchestrates builtin registered in the registry.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from .contracts import (
@@ -75,6 +75,8 @@ class ValidationEngine:
         self.policy = policy or Policy()
         self.registry = registry
         self.strict_mode = strict_mode
+        # Cached execution plan: (registry version, policy, plan)
+        self._plan_cache: Optional[tuple] = None
     
     def evaluate(
         self,
@@ -97,30 +99,19 @@ class ValidationEngine:
         - In shadow mode, converts all BLOCK to WARN
         - Applies overrides and exceptions
         """
-        # Get builtin to execute
+        # Get builtin to execute, paired with their policy config
         if validators is None:
-            validators = self._get_validators_to_execute()
-            
-            # Defensive check: ensure all required validators are registered (fail-fast)
-            # This prevents users from bypassing factory functions (create_default_engine)
-            if self.policy and self.policy.validators:
-                from .bootstrap import ensure_registered
-                ensure_registered(self.registry, self.policy)
+            plan = self._get_execution_plan()
+        else:
+            plan = self._build_plan(validators)
         
-        # Sort by priority
-        validators = self._sort_validators(validators)
+        if not plan:
+            return []
         
         # Execute builtin
         decisions: List[Decision] = []
         
-        for validator in validators:
-            # Get validator configuration from policy
-            config = self.policy.get_validator_config(validator.id)
-            
-            # Skip if disabled
-            if config and not config.enabled:
-                continue
-            
+        for validator, config in plan:
             # Check exceptions
             if config and self._has_active_exception(validator.id, context, config):
                 # Exception active: add ALLOW decision with evidence
@@ -197,6 +188,48 @@ class ValidationEngine:
         
         return decisions
     
+    def _get_execution_plan(self) -> Tuple[Tuple[BaseValidator, Optional[ValidatorConfig]], ...]:
+        """
+        Enabled builtin from registry, sorted, paired with their config.
+        
+        Cached until the registry changes or self.policy is replaced.
+        (Mutating the policy in place after the first evaluation is not
+        detected; assign a new Policy instead.)
+        """
+        version = self.registry.version
+        cached = self._plan_cache
+        if cached is not None and cached[0] == version and cached[1] is self.policy:
+            return cached[2]
+        
+        validators = self._get_validators_to_execute()
+        
+        # Defensive check: ensure all required validators are registered (fail-fast)
+        # This prevents users from bypassing factory functions (create_default_engine)
+        if self.policy and self.policy.validators:
+            from .bootstrap import ensure_registered
+            ensure_registered(self.registry, self.policy)
+        
+        plan = self._build_plan(validators)
+        self._plan_cache = (version, self.policy, plan)
+        return plan
+    
+    def _build_plan(
+        self,
+        validators: List[BaseValidator],
+    ) -> Tuple[Tuple[BaseValidator, Optional[ValidatorConfig]], ...]:
+        """Sort by priority, pair with policy config, drop disabled builtin"""
+        plan = []
+        for validator in self._sort_validators(validators):
+            # Get validator configuration from policy
+            config = self.policy.get_validator_config(validator.id)
+            
+            # Skip if disabled
+            if config and not config.enabled:
+                continue
+            
+            plan.append((validator, config))
+        return tuple(plan)
+    
     def _get_validators_to_execute(self) -> List[BaseValidator]:
         """Get list of enabled builtin from registry"""
         # Registry is required (enforced in __init__)
@@ -210,7 +243,7 @@ class ValidationEngine:
         
         # If policy is empty, enable all builtin
         if not enabled_ids:
-            return all_validators
+            return list(all_validators)
         
         return [v for v in all_validators if v.id in enabled_ids]
     
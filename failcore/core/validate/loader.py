@@ -25,14 +25,29 @@ Design principles:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
-from datetime import datetime
+from typing import Optional, Union, Dict, Any, List
+from datetime import datetime, timezone
+import logging
+import os
 import yaml
 import json
 
 from .contracts import Policy, ValidatorConfig, EnforcementMode, OverrideConfig
 
+logger = logging.getLogger(__name__)
+
+# Prefer libyaml's C loader/dumper: same safe semantics, several times faster.
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+    logger.warning(
+        "PyYAML is built without libyaml; policy parsing falls back to the slow "
+        "pure-Python loader. Install libyaml (e.g. libyaml-dev) and reinstall PyYAML."
+    )
+
 
 def _validate_global_override(override: OverrideConfig, policy_name: str = "policy") -> None:
     """
@@ -84,6 +99,96 @@ def _validate_global_override(override: OverrideConfig, policy_name: str = "poli
         ) from e
 
 
+# ============================================================================
+# Core layer: pure parsing/serialization (no I/O)
+# ============================================================================
+
+def parse_policy_from_dict(data: Dict[str, Any]) -> Policy:
+    """
+    Parse policy from a plain dict (core layer, no I/O).
+    
+    Args:
+        data: Policy data (as produced by YAML/JSON parsing)
+    
+    Returns:
+        Policy object
+    
+    Raises:
+        ValueError: If data is not a mapping or fails schema validation
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"Policy must be a mapping, got {type(data).__name__}")
+    return Policy.model_validate(data)
+
+
+def parse_policy_from_str(content: str, format: str = "yaml") -> Policy:
+    """
+    Parse policy from a YAML or JSON string (core layer, no I/O).
+    
+    Args:
+        content: Serialized policy
+        format: Input format ("yaml" or "json")
+    
+    Returns:
+        Policy object
+    
+    Raises:
+        ValueError: If content is malformed or format is unsupported
+    """
+    if format == "yaml":
+        try:
+            data = yaml.load(content, Loader=_YamlLoader)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML policy: {e}") from e
+    elif format == "json":
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON policy: {e}") from e
+    else:
+        raise ValueError(f"Unsupported policy format: {format}")
+    
+    # Empty document means "all defaults"
+    if data is None:
+        data = {}
+    
+    return parse_policy_from_dict(data)
+
+
+def serialize_policy_to_dict(policy: Policy) -> Dict[str, Any]:
+    """
+    Serialize policy to a JSON-compatible dict (core layer, no I/O).
+    """
+    return policy.model_dump(mode="json")
+
+
+def serialize_policy_to_str(policy: Policy, format: str = "yaml") -> str:
+    """
+    Serialize policy to a YAML or JSON string (core layer, no I/O).
+    
+    Args:
+        policy: Policy object
+        format: Output format ("yaml" or "json")
+    
+    Returns:
+        Serialized policy string
+    """
+    data = serialize_policy_to_dict(policy)
+    
+    if format == "yaml":
+        return yaml.dump(
+            data,
+            Dumper=_YamlDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
+    if format == "json":
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    
+    raise ValueError(f"Unsupported policy format: {format}")
+
+
 # ============================================================================
 # API layer: I/O functions (use core layer for parsing)
 # ============================================================================
@@ -175,6 +280,15 @@ def save_policy(policy: Policy, path: Union[str, Path], format: Optional[str] =
     path.write_text(content, encoding="utf-8")
 
 
+def _file_exists(path: Path) -> bool:
+    """Existence probe via a bare os.stat() (skips Path.exists() wrapping)"""
+    try:
+        os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return True
+
+
 def get_policy_dir(project_root: Optional[Path] = None) -> Path:
     """
     Get .failcore/validate/ directory path.
@@ -210,6 +324,16 @@ def ensure_policy_dir(project_root: Optional[Path] = None) -> Path:
 # Three-layer policy merge (Step 4)
 # ============================================================================
 
+def _deep_copy_policy(policy: Policy) -> Policy:
+    """
+    Deep-copy a policy via a dump/validate round-trip.
+    
+    Goes through pydantic-core instead of model_copy(deep=True)'s Python-level
+    deepcopy, which is several times faster for policy-sized trees.
+    """
+    return Policy.model_validate(policy.model_dump())
+
+
 def merge_policies(
     active: Policy,
     shadow: Optional[Policy] = None,
@@ -230,8 +354,14 @@ def merge_policies(
     
     Returns:
         Merged Policy object
+    
+    Note:
+        Overlays copy only what they change. The merged policy shares
+        untouched validator configs, config dicts and exception lists with
+        its inputs (structural sharing), and none of the inputs are mutated.
+        Deep-copy the result before mutating it in place.
     """
-    merged = active.model_copy(deep=True)
+    merged = active.model_copy()
     
     if shadow:
         merged = _apply_shadow_overlay(merged, shadow)
@@ -254,23 +384,36 @@ def _apply_shadow_overlay(base: Policy, shadow: Policy) -> Policy:
     
     Shadow is not another policy - it's an execution mode variant of active.
     """
-    result = base.model_copy(deep=True)
-    
     # Validate: shadow must have same validators as base
-    if set(shadow.validators.keys()) != set(result.validators.keys()):
+    if set(shadow.validators.keys()) != set(base.validators.keys()):
         raise ValueError(
             "Shadow policy must have the same validators as active policy. "
             "Shadow mode cannot introduce new rules or remove existing ones."
         )
     
-    # Apply shadow: only change enforcement mode
-    for validator_id, shadow_config in shadow.validators.items():
-        if validator_id in result.validators:
-            # Only enforcement mode is changed
-            result.validators[validator_id].enforcement = EnforcementMode.SHADOW
-            # Config, domain, priority remain unchanged
+    # No-op: every validator is already in SHADOW mode
+    if all(c.enforcement == EnforcementMode.SHADOW for c in base.validators.values()):
+        return base
+    
+    # Apply shadow: only change enforcement mode (validator sets are equal,
+    # checked above). Config, domain, priority are shared with base.
+    validators = {
+        validator_id: config.model_copy(update={"enforcement": EnforcementMode.SHADOW})
+        for validator_id, config in base.validators.items()
+    }
+    return base.model_copy(update={"validators": validators})
+
+
+def _set_shadow_enforcement(policy: Policy) -> None:
+    """
+    Set every validator's enforcement to SHADOW in place.
     
-    return result
+    SHADOW is a known-valid enum member, so the write bypasses
+    BaseModel.__setattr__ and only records the field as explicitly set.
+    """
+    for config in policy.validators.values():
+        object.__setattr__(config, "enforcement", EnforcementMode.SHADOW)
+        config.__pydantic_fields_set__.add("enforcement")
 
 
 def _apply_breakglass_overlay(base: Policy, breakglass: Policy) -> Policy:
@@ -288,8 +431,15 @@ def _apply_breakglass_overlay(base: Policy, breakglass: Policy) -> Policy:
     - Change validator domain / priority / logic
     - Remove validators
     - Add long-term exceptions (must have expires_at)
+    
+    Only validators the breakglass policy actually changes are copied; the
+    rest are shared with base.
     """
-    result = base.model_copy(deep=True)
+    # No-op: the default (empty, override disabled) breakglass template
+    if not breakglass.global_override.enabled and not breakglass.validators:
+        return base
+    
+    update: Dict[str, Any] = {}
     
     # Apply global override (with strict validation)
     # Note: breakglass.global_override was already validated in load_policy(),
@@ -297,43 +447,64 @@ def _apply_breakglass_overlay(base: Policy, breakglass: Policy) -> Policy:
     # This is intentional duplication for defense-in-depth.
     if breakglass.global_override.enabled:
         _validate_global_override(breakglass.global_override, "breakglass")
-        result.global_override = breakglass.global_override.model_copy(deep=True)
+        update["global_override"] = breakglass.global_override.model_copy(deep=True)
+    
+    # Strict: breakglass cannot add new validators (report all offenders at once)
+    missing = breakglass.validators.keys() - base.validators.keys()
+    if missing:
+        raise ValueError(
+            f"Breakglass policy cannot add new validators: {', '.join(sorted(missing))}. "
+            f"Breakglass can only add exceptions or override enforcement for existing validators."
+        )
     
     # Apply exceptions and overrides (only to existing validators)
+    validators = dict(base.validators)
     for validator_id, breakglass_config in breakglass.validators.items():
-        if validator_id not in result.validators:
-            # Strict: breakglass cannot add new validators
-            raise ValueError(
-                f"Breakglass policy cannot add new validator '{validator_id}'. "
-                f"Breakglass can only add exceptions or override enforcement for existing validators."
-            )
+        base_config = validators[validator_id]
+        changes: Dict[str, Any] = {}
         
-        base_config = result.validators[validator_id]
-        
-        # Add exceptions (validate they have expires_at)
+        # Add exceptions (validate they have expires_at), then attach the
+        # combined list with a single assignment
         if breakglass_config.exceptions:
-            for exc in breakglass_config.exceptions:
-                if not exc.expires_at:
-                    raise ValueError(
-                        f"Breakglass exception for '{validator_id}' must have expires_at. "
-                        f"Emergency overrides cannot be permanent."
-                    )
-            base_config.exceptions.extend(breakglass_config.exceptions)
+            if not all(exc.expires_at for exc in breakglass_config.exceptions):
+                raise ValueError(
+                    f"Breakglass exception for '{validator_id}' must have expires_at. "
+                    f"Emergency overrides cannot be permanent."
+                )
+            changes["exceptions"] = base_config.exceptions + list(breakglass_config.exceptions)
         
         # Override enforcement mode (temporary downgrade only)
         if breakglass_config.enforcement != EnforcementMode.BLOCK:
-            base_config.enforcement = breakglass_config.enforcement
+            changes["enforcement"] = breakglass_config.enforcement
         
         # Enable override flag
         if breakglass_config.allow_override:
-            base_config.allow_override = True
+            changes["allow_override"] = True
         
         # Strict: cannot change config
-        if breakglass_config.config and breakglass_config.config != base_config.config:
-            # Allow if breakglass config is empty or same
-            pass  # Config changes are ignored (breakglass cannot modify config)
+        # Config changes are ignored (breakglass cannot modify config)
+        
+        if changes:
+            validators[validator_id] = base_config.model_copy(update=changes)
     
-    return result
+    update["validators"] = validators
+    return base.model_copy(update=update)
+
+
+def _load_policies(paths: List[Optional[Path]]) -> List[Optional[Policy]]:
+    """
+    Load several policy files, overlapping file I/O and parsing across threads.
+    
+    None entries are passed through as None. Results keep the input order, and
+    errors surface in that order too (active before shadow before breakglass).
+    """
+    present = [p for p in paths if p is not None]
+    if len(present) <= 1:
+        return [load_policy(p) if p is not None else None for p in paths]
+    
+    with ThreadPoolExecutor(max_workers=len(present)) as pool:
+        futures = [pool.submit(load_policy, p) if p is not None else None for p in paths]
+        return [f.result() if f is not None else None for f in futures]
 
 
 def load_merged_policy(
@@ -376,7 +547,7 @@ def load_merged_policy(
     
     # Auto-initialize if needed (idempotent)
     active_path = policy_dir / "active.yaml"
-    if not active_path.exists():
+    if not _file_exists(active_path):
         if auto_init:
             ensure_policy_files(project_root)
         else:
@@ -386,56 +557,84 @@ def load_merged_policy(
                 f"Or set auto_init=True when calling load_merged_policy()"
             )
     
-    # Load active (required)
-    active = load_policy(active_path)
-    
-    # Load shadow (optional, must be derived from active)
-    shadow = None
-    if use_shadow:
-        shadow_path = policy_dir / "shadow.yaml"
-        if shadow_path.exists():
-            shadow = load_policy(shadow_path)
-            # Validate shadow is derived from active (same validators)
-            if set(shadow.validators.keys()) != set(active.validators.keys()):
+    # Load active (required) plus any requested overlays that exist on disk.
+    shadow_path = policy_dir / "shadow.yaml"
+    breakglass_path = policy_dir / "breakglass.yaml"
+    active, shadow, breakglass = _load_policies([
+        active_path,
+        shadow_path if use_shadow and _file_exists(shadow_path) else None,
+        breakglass_path if use_breakglass and _file_exists(breakglass_path) else None,
+    ])
+    
+    # Shadow (optional, must be derived from active)
+    if shadow is not None:
+        # Validate shadow is derived from active (same validators)
+        if set(shadow.validators.keys()) != set(active.validators.keys()):
+            raise ValueError(
+                "shadow.yaml must have the same validators as active.yaml. "
+                "Shadow mode cannot add or remove validators."
+            )
+    
+    # Breakglass (optional, strict restrictions)
+    if breakglass is not None:
+        # One clock read for every exception expiry check below
+        now = datetime.now(timezone.utc)
+        
+        # Validate breakglass restrictions
+        for validator_id, breakglass_config in breakglass.validators.items():
+            # 1. Cannot add new validators
+            if validator_id not in active.validators:
                 raise ValueError(
-                    "shadow.yaml must have the same validators as active.yaml. "
-                    "Shadow mode cannot add or remove validators."
+                    f"Breakglass cannot add new validator '{validator_id}'. "
+                    f"Breakglass can only add exceptions or override enforcement for existing validators."
                 )
-    
-    # Load breakglass (optional, strict restrictions)
-    breakglass = None
-    if use_breakglass:
-        breakglass_path = policy_dir / "breakglass.yaml"
-        if breakglass_path.exists():
-            breakglass = load_policy(breakglass_path)
-            # Validate breakglass restrictions
-            for validator_id, breakglass_config in breakglass.validators.items():
-                # 1. Cannot add new validators
-                if validator_id not in active.validators:
+            
+            # 2. Exceptions must have expires_at (cannot be permanent)
+            for exc in breakglass_config.exceptions:
+                if not exc.expires_at:
                     raise ValueError(
-                        f"Breakglass cannot add new validator '{validator_id}'. "
-                        f"Breakglass can only add exceptions or override enforcement for existing validators."
+                        f"Breakglass exception for validator '{validator_id}' (rule: {exc.rule_id}) "
+                        f"must have expires_at. Emergency overrides cannot be permanent."
                     )
                 
-                # 2. Exceptions must have expires_at (cannot be permanent)
-                for exc in breakglass_config.exceptions:
-                    if not exc.expires_at:
-                        raise ValueError(
-                            f"Breakglass exception for validator '{validator_id}' (rule: {exc.rule_id}) "
-                            f"must have expires_at. Emergency overrides cannot be permanent."
-                        )
-                    
-                    # Check if already expired
-                    if exc.is_expired():
-                        raise ValueError(
-                            f"Breakglass exception for validator '{validator_id}' (rule: {exc.rule_id}) "
-                            f"has already expired: {exc.expires_at}"
-                        )
+                # Check if already expired
+                if exc.is_expired(now):
+                    raise ValueError(
+                        f"Breakglass exception for validator '{validator_id}' (rule: {exc.rule_id}) "
+                        f"has already expired: {exc.expires_at}"
+                    )
     
+    # No overlays: active was freshly parsed above and is not shared with
+    # anyone else, so the deep copy in merge_policies() buys nothing.
+    if shadow is None and breakglass is None:
+        return active
+
     # Merge (will raise ValueError if breakglass violations)
     return merge_policies(active, shadow=shadow, breakglass=breakglass)
 
 
+# Pre-rendered breakglass.yaml template (empty, override disabled by default).
+# Equivalent to dumping an empty Policy with this metadata; kept as a string so
+# init_policy_files() skips pydantic + YAML serialization for a constant file.
+_BREAKGLASS_TEMPLATE_YAML = """\
+version: v1
+validators: {{}}
+global_override:
+  enabled: false
+  require_token: true
+  token_env_var: FAILCORE_OVERRIDE_TOKEN
+  expires_at: null
+  audit_required: true
+metadata:
+  name: breakglass
+  description: Emergency override policy - use with extreme caution
+  created_at: '{created_at}'
+  warning: 'This file should remain empty by default. Only add exceptions when emergency
+    override is needed. Breakglass can only: add exceptions (with expires_at), enable
+    override, or downgrade enforcement. It cannot add new validators or change config.'
+"""
+
+
 def init_policy_files(project_root: Optional[Path] = None, force: bool = False) -> None:
     """
     Initialize policy files in .failcore/validate/ directory.
@@ -465,6 +664,8 @@ def init_policy_files(project_root: Optional[Path] = None, force: bool = False)
     from .templates import default_safe_policy
     
     # 1. Create active.yaml (main policy, required)
+    # Kept in memory so shadow derivation doesn't re-read the file just written
+    active_policy: Optional[Policy] = None
     active_path = policy_dir / "active.yaml"
     if not active_path.exists() or force:
         active_policy = default_safe_policy()
@@ -479,16 +680,16 @@ def init_policy_files(project_root: Optional[Path] = None, force: bool = False)
     # 2. Create shadow.yaml (derived from active, enforcement=SHADOW)
     shadow_path = policy_dir / "shadow.yaml"
     if not shadow_path.exists() or force:
-        # Load active policy first (must exist)
-        if active_path.exists():
-            active_policy = load_policy(active_path)
-        else:
-            active_policy = default_safe_policy()
+        # Derive from the active policy; read it only if step 1 kept the existing file
+        if active_policy is None:
+            if active_path.exists():
+                active_policy = load_policy(active_path)
+            else:
+                active_policy = default_safe_policy()
         
         # Derive shadow: same structure, all enforcement = SHADOW
-        shadow_policy = active_policy.model_copy(deep=True)
-        for validator_id, config in shadow_policy.validators.items():
-            config.enforcement = EnforcementMode.SHADOW
+        shadow_policy = _deep_copy_policy(active_policy)
+        _set_shadow_enforcement(shadow_policy)
         
         shadow_policy.metadata.update({
             "name": "shadow",
@@ -503,28 +704,12 @@ def init_policy_files(project_root: Optional[Path] = None, force: bool = False)
     # 3. Create breakglass.yaml (empty template, disabled)
     breakglass_path = policy_dir / "breakglass.yaml"
     if not breakglass_path.exists() or force:
-        breakglass_policy = Policy(
-            version="v1",
-            validators={},  # Empty - breakglass cannot add validators
-            global_override=OverrideConfig(
-                enabled=False,  # Disabled by default
-                require_token=True,
-                token_env_var="FAILCORE_OVERRIDE_TOKEN",
-                audit_required=True,
-            ),
-            metadata={
-                "name": "breakglass",
-                "description": "Emergency override policy - use with extreme caution",
-                "created_at": datetime.now().isoformat(),
-                "warning": (
-                    "This file should remain empty by default. "
-                    "Only add exceptions when emergency override is needed. "
-                    "Breakglass can only: add exceptions (with expires_at), enable override, "
-                    "or downgrade enforcement. It cannot add new validators or change config."
-                ),
-            },
+        # Constant content: write the pre-rendered template instead of
+        # building a Policy and serializing it
+        breakglass_path.write_text(
+            _BREAKGLASS_TEMPLATE_YAML.format(created_at=datetime.now().isoformat()),
+            encoding="utf-8",
         )
-        save_policy(breakglass_policy, breakglass_path)
 
 
 def ensure_policy_files(project_root: Optional[Path] = None) -> bool:
@@ -551,7 +736,7 @@ def ensure_policy_files(project_root: Optional[Path] = None) -> bool:
     active_path = policy_dir / "active.yaml"
     
     # Check if initialization is needed
-    if active_path.exists():
+    if _file_exists(active_path):
         return False
     
     # Initialize (idempotent)
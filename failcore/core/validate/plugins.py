@@ -28,7 +28,7 @@ setup(
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 import importlib.metadata
 import logging
 
@@ -42,10 +42,63 @@ VALIDATOR_ENTRY_POINT_GROUP = "failcore.builtin"
 logger = logging.getLogger(__name__)
 
 
+# Loaded entry-point targets as (entry_point, target) pairs. Populated by the
+# first discovery so later calls skip the entry_points() metadata scan.
+_discovered_targets: Optional[List[Tuple[Any, Any]]] = None
+
+
+def _load_entry_point_targets() -> List[Tuple[Any, Any]]:
+    """
+    Scan the validator entry point group and import each target.
+    
+    Targets that fail to import, or that are neither a BaseValidator
+    subclass nor a BaseValidator instance, are logged and skipped here so
+    discovery never has to re-check them.
+    """
+    targets = []
+    
+    try:
+        # Select the group directly instead of materializing every entry point
+        validator_eps = importlib.metadata.entry_points(group=VALIDATOR_ENTRY_POINT_GROUP)
+    except Exception as e:
+        logger.error(f"Failed to discover plugin builtin: {e}", exc_info=True)
+        return targets
+    
+    for ep in validator_eps:
+        try:
+            target = ep.load()
+        except Exception as e:
+            logger.warning(
+                f"Failed to load plugin validator '{ep.name}' from '{ep.value}': {e}",
+                exc_info=True
+            )
+            continue
+        
+        # Verify it implements BaseValidator interface
+        if isinstance(target, type):
+            is_validator = issubclass(target, BaseValidator)
+        else:
+            is_validator = isinstance(target, BaseValidator)
+        if not is_validator:
+            logger.warning(
+                f"Plugin validator '{ep.name}' from '{ep.value}' "
+                f"does not implement BaseValidator interface. Skipping."
+            )
+            continue
+        
+        targets.append((ep, target))
+    
+    return targets
+
+
 def discover_plugin_validators() -> List[BaseValidator]:
     """
     Discover plugin builtin via entry_points.
     
+    The entry point scan runs once per process; each call still returns
+    fresh instances for class targets. Use invalidate_plugin_cache() to
+    force a rescan (e.g., in tests that install plugins).
+    
     Returns:
         List of validator instances from plugins
     
@@ -53,55 +106,43 @@ def discover_plugin_validators() -> List[BaseValidator]:
         Plugins that fail to load are logged and skipped.
         This ensures core functionality isn't broken by bad plugins.
     """
-    validators = []
+    global _discovered_targets
     
-    try:
-        # Get all entry points for validator group
-        entry_points = importlib.metadata.entry_points()
-        
-        # Handle different importlib.metadata APIs
-        if hasattr(entry_points, 'select'):
-            # Python 3.10+
-            validator_eps = entry_points.select(group=VALIDATOR_ENTRY_POINT_GROUP)
-        else:
-            # Python 3.9 - entry_points() returns dict-like object
-            validator_eps = entry_points.get(VALIDATOR_ENTRY_POINT_GROUP, []) if hasattr(entry_points, 'get') else []
-        
-        for ep in validator_eps:
-            try:
-                # Load the entry point
-                validator_cls = ep.load()
-                
-                # Instantiate if it's a class
-                if isinstance(validator_cls, type):
-                    validator = validator_cls()
-                else:
-                    validator = validator_cls
-                
-                # Verify it implements BaseValidator interface
-                if not isinstance(validator, BaseValidator):
-                    logger.warning(
-                        f"Plugin validator '{ep.name}' from '{ep.value}' "
-                        f"does not implement BaseValidator interface. Skipping."
-                    )
-                    continue
-                
-                validators.append(validator)
-                logger.info(f"Loaded plugin validator: {validator.id} from {ep.value}")
-                
-            except Exception as e:
-                logger.warning(
-                    f"Failed to load plugin validator '{ep.name}' from '{ep.value}': {e}",
-                    exc_info=True
-                )
-                continue
+    targets = _discovered_targets
+    if targets is None:
+        targets = _discovered_targets = _load_entry_point_targets()
     
-    except Exception as e:
-        logger.error(f"Failed to discover plugin builtin: {e}", exc_info=True)
+    log_loaded = logger.isEnabledFor(logging.INFO)
+    
+    validators = []
+    for ep, validator_cls in targets:
+        try:
+            # Instantiate if it's a class (targets are pre-filtered by type)
+            if isinstance(validator_cls, type):
+                validator = validator_cls()
+            else:
+                validator = validator_cls
+            
+            validators.append(validator)
+            if log_loaded:
+                logger.info(f"Loaded plugin validator: {validator.id} from {ep.value}")
+            
+        except Exception as e:
+            logger.warning(
+                f"Failed to load plugin validator '{ep.name}' from '{ep.value}': {e}",
+                exc_info=True
+            )
+            continue
     
     return validators
 
 
+def invalidate_plugin_cache() -> None:
+    """Drop cached entry point discovery so the next call rescans (useful for testing)"""
+    global _discovered_targets
+    _discovered_targets = None
+
+
 def load_plugins(registry: ValidatorRegistry) -> int:
     """
     Discover and register plugin builtin.
@@ -192,6 +233,7 @@ class PluginValidator:
 
 __all__ = [
     "discover_plugin_validators",
+    "invalidate_plugin_cache",
     "load_plugins",
     "is_plugin_system_available",
     "VALIDATOR_ENTRY_POINT_GROUP",
@@ -12,17 +12,26 @@ Design principles:
 - Single source of truth for available builtin
 - No hard-coded validator imports
 - Supports both built-in and plugin builtin
-- Thread-safe (uses locks for registration)
+- Thread-safe (writes swap immutable snapshots under a lock; reads are lock-free)
 """
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, ValuesView
 import threading
 
 from .validator import BaseValidator
 
 
+def _check_validator(validator: BaseValidator) -> None:
+    """Reject validators missing the required id/domain attributes"""
+    if not getattr(validator, "id", None) or not getattr(validator, "domain", None):
+        raise TypeError(
+            f"{validator.__class__.__name__} must define non-empty 'id' and 'domain'"
+        )
+
+
 class ValidatorRegistry:
     """
     Central registry for all builtin.
@@ -51,9 +60,32 @@ class ValidatorRegistry:
     """
     
     def __init__(self):
-        self._validators: Dict[str, BaseValidator] = {}
+        # Read-only snapshots, swapped atomically under the lock on every
+        # write. Readers take no lock and always see a consistent state.
+        self._validators: Mapping[str, BaseValidator] = MappingProxyType({})
+        # Secondary index rebuilt on write so domain lookups are O(1)
+        self._by_domain: Mapping[str, Tuple[BaseValidator, ...]] = MappingProxyType({})
+        self._domains_sorted: Tuple[str, ...] = ()
+        # Bumped on every write so consumers can cache derived data
+        self._version = 0
         self._lock = threading.Lock()
     
+    def _publish(self, validators: Dict[str, BaseValidator]) -> None:
+        """Swap in new snapshots built from validators (caller holds the lock)"""
+        by_domain: Dict[str, Tuple[BaseValidator, ...]] = {}
+        for validator in validators.values():
+            by_domain[validator.domain] = by_domain.get(validator.domain, ()) + (validator,)
+        
+        self._by_domain = MappingProxyType(by_domain)
+        self._domains_sorted = tuple(sorted(by_domain))
+        self._validators = MappingProxyType(validators)
+        self._version += 1
+    
+    @property
+    def version(self) -> int:
+        """Monotonic counter incremented on every register/unregister/clear"""
+        return self._version
+    
     def register(self, validator: BaseValidator) -> None:
         """
         Register a validator.
@@ -62,8 +94,10 @@ class ValidatorRegistry:
             validator: Validator instance to register
         
         Raises:
+            TypeError: If validator does not define id and domain
             ValueError: If validator ID is already registered
         """
+        _check_validator(validator)
         with self._lock:
             if validator.id in self._validators:
                 raise ValueError(
@@ -71,17 +105,37 @@ class ValidatorRegistry:
                     f"Existing: {self._validators[validator.id]}, "
                     f"New: {validator}"
                 )
-            self._validators[validator.id] = validator
+            validators = dict(self._validators)
+            validators[validator.id] = validator
+            self._publish(validators)
     
     def register_multiple(self, validators: List[BaseValidator]) -> None:
         """
         Register multiple builtin.
         
+        Registration is all-or-nothing: if any ID is already registered
+        (or repeated within the batch), nothing is registered.
+        
         Args:
             validators: List of validator instances
+        
+        Raises:
+            TypeError: If any validator does not define id and domain
+            ValueError: If any validator ID is already registered
         """
         for validator in validators:
-            self.register(validator)
+            _check_validator(validator)
+        with self._lock:
+            merged = dict(self._validators)
+            for validator in validators:
+                if validator.id in merged:
+                    raise ValueError(
+                        f"Validator '{validator.id}' is already registered. "
+                        f"Existing: {merged[validator.id]}, "
+                        f"New: {validator}"
+                    )
+                merged[validator.id] = validator
+            self._publish(merged)
     
     def unregister(self, validator_id: str) -> None:
         """
@@ -92,7 +146,9 @@ class ValidatorRegistry:
         """
         with self._lock:
             if validator_id in self._validators:
-                del self._validators[validator_id]
+                validators = dict(self._validators)
+                del validators[validator_id]
+                self._publish(validators)
     
     def get(self, validator_id: str) -> Optional[BaseValidator]:
         """
@@ -110,14 +166,16 @@ class ValidatorRegistry:
         """Check if validator is registered"""
         return validator_id in self._validators
     
-    def list_validators(self) -> List[BaseValidator]:
+    def list_validators(self) -> ValuesView[BaseValidator]:
         """
         List all registered builtin.
         
         Returns:
-            List of all builtin (unordered)
+            Read-only view of all builtin (unordered). The view is of the
+            current snapshot, so later registrations don't affect it.
+            Wrap in list() if you need indexing or mutation.
         """
-        return list(self._validators.values())
+        return self._validators.values()
     
     def get_by_domain(self, domain: str) -> List[BaseValidator]:
         """
@@ -129,10 +187,7 @@ class ValidatorRegistry:
         Returns:
             List of builtin in the specified domain
         """
-        return [
-            v for v in self._validators.values()
-            if v.domain == domain
-        ]
+        return list(self._by_domain.get(domain, ()))
     
     def list_domains(self) -> List[str]:
         """
@@ -141,8 +196,11 @@ class ValidatorRegistry:
         Returns:
             Sorted list of unique domain names
         """
-        domains = {v.domain for v in self._validators.values()}
-        return sorted(domains)
+        return list(self._domains_sorted)
+    
+    def has_domain(self, domain: str) -> bool:
+        """Check if any validator is registered in domain (O(1), no list built)"""
+        return domain in self._by_domain
     
     def count(self) -> int:
         """Get count of registered builtin"""
@@ -151,7 +209,7 @@ class ValidatorRegistry:
     def clear(self) -> None:
         """Clear all registered builtin (useful for testing)"""
         with self._lock:
-            self._validators.clear()
+            self._publish({})
     
     def __repr__(self) -> str:
         return (
@@ -18,57 +18,228 @@ rules:
     enforcement: "WARN"
 """
 
-from typing import Any, Dict, List
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+import os
 import re
+import stat
+import threading
+import time
 from pathlib import Path
 
 from failcore.core.validate.builtin.output.contract import ValidationResult, PreconditionValidator
 
 
+# Bounded TTL cache of regular-file sizes for max_size rules:
+# path -> (expires_at monotonic, size or None)
+_STAT_CACHE_MAXSIZE = 1024
+_STAT_CACHE_TTL = 2.0
+_stat_cache: "OrderedDict[str, Tuple[float, Optional[int]]]" = OrderedDict()
+_stat_cache_lock = threading.Lock()
+
+
+def _stat_size(path: str) -> Optional[int]:
+    """
+    Size of path if it is a regular file, else None.
+    
+    One os.stat() per path per TTL window instead of exists/is_file/stat
+    on every rule evaluation.
+    """
+    now = time.monotonic()
+    with _stat_cache_lock:
+        entry = _stat_cache.get(path)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+    
+    try:
+        st = os.stat(path)
+        size = st.st_size if stat.S_ISREG(st.st_mode) else None
+    except (OSError, ValueError):
+        size = None
+    
+    with _stat_cache_lock:
+        _stat_cache[path] = (now + _STAT_CACHE_TTL, size)
+        _stat_cache.move_to_end(path)
+        if len(_stat_cache) > _STAT_CACHE_MAXSIZE:
+            _stat_cache.popitem(last=False)
+    return size
+
+
+# Match conditions, in the precedence order matches_param_rule() applies them
+_CONDITION_KEYS = ("contains", "regex", "equals", "max_size")
+
+
+def _rule_condition(rule: Dict[str, Any]) -> Tuple[Optional[str], Any]:
+    """Return (kind, operand) of the first condition present in rule"""
+    for kind in _CONDITION_KEYS:
+        if kind in rule:
+            return kind, rule[kind]
+    return None, None
+
+
+@lru_cache(maxsize=256)
+def _compile_tool_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile a wildcard tool pattern ('*', '?') into an anchored regex"""
+    regex = pattern.replace("*", ".*").replace("?", ".")
+    return re.compile(f"^{regex}$")
+
+
 def matches_tool_pattern(tool_name: str, pattern: str) -> bool:
     """Check if tool name matches pattern (supports wildcards)"""
     if "*" in pattern or "?" in pattern:
-        regex = pattern.replace("*", ".*").replace("?", ".")
-        return bool(re.match(f"^{regex}$", tool_name))
+        return bool(_compile_tool_pattern(pattern).match(tool_name))
     return tool_name == pattern
 
 
+class CompiledRules:
+    """
+    Rules precompiled once (at rule-load time) with a tool-name index.
+    
+    Literal tool rules are bucketed by tool name; wildcard rules and rules
+    without a "tool" key are kept in a scan list. Candidates for a tool name
+    are resolved once, kept in original rule order (first match wins), and
+    memoized per tool name.
+    """
+    
+    def __init__(self, rules: List[Dict[str, Any]]):
+        self.rules: List[Dict[str, Any]] = rules
+        self._literal: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        self._scan: List[Tuple[int, Dict[str, Any]]] = []
+        self._candidates: Dict[str, Tuple[Dict[str, Any], ...]] = {}
+        
+        for index, rule in enumerate(rules):
+            pattern = rule.get("tool")
+            if pattern is None or "_tool_re" in rule:
+                self._scan.append((index, rule))
+            else:
+                self._literal.setdefault(pattern, []).append((index, rule))
+    
+    def candidates(self, tool_name: str) -> Tuple[Dict[str, Any], ...]:
+        """Rules whose tool pattern matches tool_name, in original order"""
+        found = self._candidates.get(tool_name)
+        if found is None:
+            matched = list(self._literal.get(tool_name, ()))
+            for index, rule in self._scan:
+                tool_re = rule.get("_tool_re")
+                if tool_re is None or tool_re.match(tool_name):
+                    matched.append((index, rule))
+            matched.sort(key=lambda item: item[0])
+            found = self._candidates[tool_name] = tuple(rule for _, rule in matched)
+        return found
+    
+    def __len__(self) -> int:
+        return len(self.rules)
+
+
+def compile_rules(rules: List[Dict[str, Any]]) -> CompiledRules:
+    """
+    Precompile rule patterns once (at rule-load time).
+    
+    Rules are copied with private keys added:
+    - _tool_re: compiled regex for wildcard tool patterns
+    - _param_re: compiled regex for "regex" conditions
+    - _kind/_op: the condition that decides a match, and its operand
+    - _condition: all condition keys, as reported in evidence
+    - _rule_id/_enforcement/_severity/_code/_message: normalized result fields
+    
+    The input rules are not modified. The result can be passed to
+    expr_rules_validator() repeatedly without recompiling per call.
+    """
+    compiled = []
+    for rule in rules:
+        rule = dict(rule)
+        pattern = rule.get("tool")
+        if pattern is not None and ("*" in pattern or "?" in pattern):
+            rule["_tool_re"] = _compile_tool_pattern(pattern)
+        if "regex" in rule:
+            rule["_param_re"] = re.compile(rule["regex"])
+        rule["_kind"], rule["_op"] = _rule_condition(rule)
+        rule["_condition"] = {k: rule[k] for k in _CONDITION_KEYS if k in rule}
+        rule_id = rule.get("id", "unknown_rule")
+        rule["_rule_id"] = rule_id
+        rule["_enforcement"] = rule.get("enforcement", "WARN").upper()
+        rule["_severity"] = "error" if rule["_enforcement"] == "BLOCK" else "warning"
+        rule["_code"] = f"FC_EXPR_{rule_id.upper()}"
+        rule["_message"] = rule.get("message", f"Matched data rule: {rule_id}")
+        compiled.append(rule)
+    return CompiledRules(compiled)
+
+
+# Bounded memo of compile_rules() for raw rule lists passed straight to
+# expr_rules_validator(): id(list) -> (list, snapshot, compiled).
+# The list itself is kept so its id cannot be reused while cached, and the
+# snapshot catches rules edited in place since they were compiled.
+_COMPILED_CACHE_MAXSIZE = 64
+_compiled_cache: "OrderedDict[int, Tuple[List[Dict[str, Any]], List[Dict[str, Any]], CompiledRules]]" = OrderedDict()
+_compiled_cache_lock = threading.Lock()
+
+
+def _compiled_for(rules: List[Dict[str, Any]]) -> CompiledRules:
+    """compile_rules(rules), compiled once per list while its content is unchanged"""
+    key = id(rules)
+    with _compiled_cache_lock:
+        entry = _compiled_cache.get(key)
+        if entry is not None and entry[0] is rules and entry[1] == rules:
+            _compiled_cache.move_to_end(key)
+            return entry[2]
+    
+    compiled = compile_rules(rules)
+    snapshot = [dict(rule) for rule in rules]
+    with _compiled_cache_lock:
+        _compiled_cache[key] = (rules, snapshot, compiled)
+        _compiled_cache.move_to_end(key)
+        if len(_compiled_cache) > _COMPILED_CACHE_MAXSIZE:
+            _compiled_cache.popitem(last=False)
+    return compiled
+
+
 def matches_param_rule(param_value: Any, rule: Dict[str, Any]) -> bool:
     """Check if parameter value matches rule conditions"""
+    if "_kind" in rule:
+        kind, operand = rule["_kind"], rule["_op"]
+    else:
+        kind, operand = _rule_condition(rule)
+    
     # contains check
-    if "contains" in rule:
-        if isinstance(param_value, str):
-            return rule["contains"] in param_value
-        return False
+    if kind == "contains":
+        return isinstance(param_value, str) and operand in param_value
     
     # regex check
-    if "regex" in rule:
+    if kind == "regex":
         if isinstance(param_value, str):
-            return bool(re.search(rule["regex"], param_value))
+            param_re = rule.get("_param_re")
+            if param_re is not None:
+                return bool(param_re.search(param_value))
+            return bool(re.search(operand, param_value))
         return False
     
     # equals check
-    if "equals" in rule:
-        return param_value == rule["equals"]
+    if kind == "equals":
+        return param_value == operand
     
     # max_size check (for file paths)
-    if "max_size" in rule:
+    if kind == "max_size":
         if isinstance(param_value, (str, Path)):
-            try:
-                path = Path(param_value)
-                if path.exists() and path.is_file():
-                    return path.stat().st_size > rule["max_size"]
-            except Exception:
-                pass
+            size = _stat_size(str(param_value))
+            return size is not None and size > operand
         return False
     
     return False
 
 
+# Shared "no rules matched" result (treat as read-only)
+_EXPR_OK = ValidationResult(
+    passed=True,
+    code="FC_EXPR_OK",
+    message="No data rules matched"
+)
+
+
 def expr_rules_validator(
     tool_name: str,
     params: Dict[str, Any],
-    rules: List[Dict[str, Any]],
+    rules: Union[List[Dict[str, Any]], CompiledRules],
 ) -> ValidationResult:
     """
     Data-driven rules validator
@@ -76,7 +247,8 @@ def expr_rules_validator(
     Args:
         tool_name: Tool name
         params: Tool parameters
-        rules: List of rules, each rule contains:
+        rules: List of rules (raw, or precompiled via compile_rules()); raw
+            lists are compiled once and reused while unchanged. Each rule contains:
             - id: Rule unique identifier
             - tool: Tool name pattern (supports wildcards)
             - param: Parameter name to check
@@ -87,43 +259,32 @@ def expr_rules_validator(
     Returns:
         ValidationResult
     """
-    for rule in rules:
-        # Check if tool name matches
-        if "tool" in rule and not matches_tool_pattern(tool_name, rule["tool"]):
-            continue
-        
+    if not isinstance(rules, CompiledRules):
+        rules = _compiled_for(rules)
+    
+    # Only rules whose tool pattern matches this tool name
+    for rule in rules.candidates(tool_name):
         # Check parameter
         param_name = rule.get("param")
         if param_name and param_name in params:
             param_value = params[param_name]
             
             if matches_param_rule(param_value, rule):
-                rule_id = rule.get("id", "unknown_rule")
-                message = rule.get("message", f"Matched data rule: {rule_id}")
-                enforcement = rule.get("enforcement", "WARN").upper()
-                
                 return ValidationResult(
                     passed=False,
-                    code=f"FC_EXPR_{rule_id.upper()}",
-                    message=message,
-                    severity="error" if enforcement == "BLOCK" else "warning",
+                    code=rule["_code"],
+                    message=rule["_message"],
+                    severity=rule["_severity"],
                     evidence={
-                        "rule_id": rule_id,
+                        "rule_id": rule["_rule_id"],
                         "tool": tool_name,
                         "param": param_name,
                         "value": str(param_value)[:100],  # truncate long values
-                        "matched_condition": {
-                            k: v for k, v in rule.items()
-                            if k in ["contains", "regex", "equals", "max_size"]
-                        }
+                        "matched_condition": dict(rule["_condition"]),
                     }
                 )
     
-    return ValidationResult(
-        passed=True,
-        code="FC_EXPR_OK",
-        message="No data rules matched"
-    )
+    return _EXPR_OK
 
 
 # Export as PreconditionValidator
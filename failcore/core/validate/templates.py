@@ -17,7 +17,7 @@ Design principles:
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
 from .contracts import (
     Policy,
@@ -27,6 +27,10 @@ from .contracts import (
 )
 
 
+# Built on first use; default_safe_policy() hands out copies of it
+_DEFAULT_SAFE_TEMPLATE: Optional[Policy] = None
+
+
 def default_safe_policy() -> Policy:
     """
     Default safe policy for general use.
@@ -37,7 +41,17 @@ def default_safe_policy() -> Policy:
     - Resource: Basic limits
     
     Mode: BLOCK (strict enforcement)
+    
+    Returns a fresh copy on every call, so callers may mutate it freely.
     """
+    global _DEFAULT_SAFE_TEMPLATE
+    if _DEFAULT_SAFE_TEMPLATE is None:
+        _DEFAULT_SAFE_TEMPLATE = _build_default_safe_policy()
+    return Policy.model_validate(_DEFAULT_SAFE_TEMPLATE.model_dump())
+
+
+def _build_default_safe_policy() -> Policy:
+    """Construct the default safe policy graph (see default_safe_policy)"""
     return Policy(
         version="v1",
         validators={
@@ -255,14 +269,16 @@ def permissive_policy() -> Policy:
     )
 
 
-# Preset registry
-POLICY_PRESETS: Dict[str, Policy] = {
-    "default_safe": default_safe_policy(),
-    "fs_safe": fs_safe_policy(),
-    "net_safe": net_safe_policy(),
-    "shadow_mode": shadow_mode_policy(),
-    "permissive": permissive_policy(),
+# Preset registry: factories are cheap to hold; each preset Policy is built
+# on first lookup instead of at import time.
+_PRESET_FACTORIES: Dict[str, Callable[[], Policy]] = {
+    "default_safe": default_safe_policy,
+    "fs_safe": fs_safe_policy,
+    "net_safe": net_safe_policy,
+    "shadow_mode": shadow_mode_policy,
+    "permissive": permissive_policy,
 }
+_preset_instances: Dict[str, Policy] = {}
 
 
 def get_preset(name: str) -> Optional[Policy]:
@@ -274,8 +290,19 @@ def get_preset(name: str) -> Optional[Policy]:
     
     Returns:
         PolicyV1 instance or None if not found
+    
+    Note:
+        The returned instance is shared by every caller and must be treated
+        as read-only. Deep-copy it (or call the *_policy() factory) before
+        modifying.
     """
-    return POLICY_PRESETS.get(name)
+    preset = _preset_instances.get(name)
+    if preset is None:
+        factory = _PRESET_FACTORIES.get(name)
+        if factory is None:
+            return None
+        preset = _preset_instances[name] = factory()
+    return preset
 
 
 def list_presets() -> list[str]:
@@ -285,7 +312,14 @@ def list_presets() -> list[str]:
     Returns:
         List of preset names
     """
-    return list(POLICY_PRESETS.keys())
+    return list(_PRESET_FACTORIES.keys())
+
+
+def __getattr__(name: str):
+    # POLICY_PRESETS is materialized on access (kept for backward compatibility)
+    if name == "POLICY_PRESETS":
+        return {preset_name: get_preset(preset_name) for preset_name in _PRESET_FACTORIES}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
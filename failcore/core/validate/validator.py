@@ -14,7 +14,6 @@ Design principles:
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
 from .contracts import (
@@ -25,7 +24,7 @@ from .contracts import (
 )
 
 
-class BaseValidator(ABC):
+class BaseValidator:
     """
     Base validator interface.
     
@@ -36,28 +35,21 @@ class BaseValidator(ABC):
     - domain: Validator domain/pack (e.g., 'security', 'network')
     - config_schema: JSON schema for validator configuration
     - evaluate: Execute validation and return decisions
+    
+    This is a plain class (no ABC metaclass) so constructing validators
+    stays cheap. Subclasses must provide ``id`` and ``domain`` (as class
+    attributes or properties); ValidatorRegistry.register rejects
+    validators that don't.
     """
     
-    @property
-    @abstractmethod
-    def id(self) -> str:
-        """
-        Unique validator identifier.
-        
-        Convention: Use lowercase with underscores (e.g., 'network_ssrf')
-        """
-        pass
+    # Unique validator identifier.
+    # Convention: Use lowercase with underscores (e.g., 'network_ssrf')
+    id: str
     
-    @property
-    @abstractmethod
-    def domain(self) -> str:
-        """
-        Validator domain/pack.
-        
-        Standard domains: 'contract', 'type', 'security', 'network', 'resource'
-        Custom domains are allowed for extensions.
-        """
-        pass
+    # Validator domain/pack.
+    # Standard domains: 'contract', 'type', 'security', 'network', 'resource'
+    # Custom domains are allowed for extensions.
+    domain: str
     
     @property
     def config_schema(self) -> Optional[Dict[str, Any]]:
@@ -86,7 +78,6 @@ class BaseValidator(ABC):
         """
         return {}
     
-    @abstractmethod
     def evaluate(
         self,
         context: Context,
@@ -108,10 +99,15 @@ class BaseValidator(ABC):
         - Decisions can be ALLOW, WARN, or BLOCK
         - Each decision must have a stable code (e.g., FC_NET_SSRF_INTERNAL)
         """
-        pass
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement evaluate()"
+        )
     
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(id={self.id!r}, domain={self.domain!r})"
+        return (
+            f"{self.__class__.__name__}("
+            f"id={getattr(self, 'id', None)!r}, domain={getattr(self, 'domain', None)!r})"
+        )
 
 
 __all__ = [
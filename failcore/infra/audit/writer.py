@@ -3,10 +3,15 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import is_dataclass, asdict
-from datetime import datetime
+from dataclasses import fields, is_dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson  # optional fast path: pip install failcore[fast]
+except ImportError:
+    orjson = None
 
 
 JsonPrimitive = Union[str, int, float, bool, None]
@@ -19,87 +24,277 @@ def _truncate_str(s: str, limit: int = 4096) -> str:
     return s[:limit] + "…"
 
 
-def _json_safe(obj: Any, *, str_limit: int = 4096, depth: int = 0, max_depth: int = 20) -> Any:
-    """
-    Convert arbitrary objects into JSON-serializable structures.
+# Values asdict() would deep-copy but which are immutable anyway
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None), bytes, datetime})
 
-    Policy (v0.1):
-      - dict/list/tuple/set -> recursively convert
-      - dataclass -> asdict then convert
-      - Enum -> value if present else str()
-      - datetime -> ISO string (UTC if tz-aware is missing, keep as-is but strftime safe)
-      - bytes -> hex digest-like preview
-      - unknown -> str(obj) truncated
+# dataclass type -> field names
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
 
-    Max depth prevents pathological recursion.
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+    return names
+
+
+def _asdict_value(v: Any) -> Any:
+    if type(v) in _ATOMIC_TYPES:
+        return v
+    if is_dataclass(v) and not isinstance(v, type):
+        return _shallow_asdict(v)
+    if isinstance(v, list):
+        return [_asdict_value(x) for x in v]
+    if isinstance(v, tuple):
+        if hasattr(v, "_fields"):  # namedtuple
+            return type(v)(*[_asdict_value(x) for x in v])
+        return type(v)(_asdict_value(x) for x in v)
+    if isinstance(v, dict):
+        return type(v)((k, _asdict_value(x)) for k, x in v.items())
+    return v
+
+
+def _shallow_asdict(obj: Any) -> Dict[str, Any]:
+    """
+    dataclasses.asdict() without the deepcopy of leaf values.
+
+    Nested dataclasses and list/tuple/dict containers are rebuilt like
+    asdict() does; everything else is shared with obj, which is fine
+    because the result is only serialized, never mutated.
     """
-    if depth > max_depth:
-        return "<max_depth_reached>"
+    return {name: _asdict_value(getattr(obj, name)) for name in _field_names(type(obj))}
+
+
+def _json_pass(obj: Any, str_limit: int) -> Any:
+    return obj
+
+
+def _json_bytes_preview(obj: Any, str_limit: int) -> Any:
+    # don't dump raw bytes; show a short preview
+    hx = obj[:32].hex()
+    return f"<bytes len={len(obj)} hex_prefix={hx}>"
+
 
+def _json_dt_iso(obj: Any, str_limit: int) -> Any:
+    try:
+        # keep microseconds out for readability
+        dt = obj
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc)
+        dt = dt.replace(microsecond=0)
+        s = dt.isoformat()
+        # normalize UTC suffix if possible
+        if s.endswith("+00:00"):
+            s = s.replace("+00:00", "Z")
+        return s
+    except Exception:
+        return _truncate_str(str(obj), str_limit)
+
+
+# Exact-type fast paths for _json_safe; subclasses and everything else
+# go through _json_classify.
+_JSON_LEAF = {
+    str: _json_pass,
+    int: _json_pass,
+    float: _json_pass,
+    bool: _json_pass,
+    type(None): _json_pass,
+    bytes: _json_bytes_preview,
+    bytearray: _json_bytes_preview,
+    datetime: _json_dt_iso,
+}
+_JSON_SEQ_TYPES = frozenset({list, tuple, set})
+
+# _json_classify results
+_JSON_KIND_LEAF = 0
+_JSON_KIND_DICT = 1
+_JSON_KIND_SEQ = 2
+_JSON_KIND_NESTED = 3  # dataclass converted to a dict one level deeper
+
+
+def _json_classify(obj: Any, str_limit: int) -> Tuple[int, Any]:
+    """Slow path of _json_safe for non-exact types: (kind, value)"""
     # primitives
     if obj is None or isinstance(obj, (str, int, float, bool)):
-        return obj
+        return _JSON_KIND_LEAF, obj
 
     # dataclass
     if is_dataclass(obj):
         try:
-            return _json_safe(asdict(obj), str_limit=str_limit, depth=depth + 1, max_depth=max_depth)
+            return _JSON_KIND_NESTED, _shallow_asdict(obj)
         except Exception:
-            return _truncate_str(str(obj), str_limit)
+            return _JSON_KIND_LEAF, _truncate_str(str(obj), str_limit)
 
     # datetime
     if isinstance(obj, datetime):
-        try:
-            # keep microseconds out for readability
-            dt = obj
-            if dt.tzinfo is not None:
-                dt = dt.astimezone(datetime.timezone.utc)  # type: ignore[attr-defined]
-            dt = dt.replace(microsecond=0)
-            s = dt.isoformat()
-            # normalize UTC suffix if possible
-            if s.endswith("+00:00"):
-                s = s.replace("+00:00", "Z")
-            return s
-        except Exception:
-            return _truncate_str(str(obj), str_limit)
+        return _JSON_KIND_LEAF, _json_dt_iso(obj, str_limit)
 
     # bytes
     if isinstance(obj, (bytes, bytearray)):
-        # don't dump raw bytes; show a short preview
-        hx = obj[:32].hex()
-        return f"<bytes len={len(obj)} hex_prefix={hx}>"
+        return _JSON_KIND_LEAF, _json_bytes_preview(obj, str_limit)
 
     # mappings
     if isinstance(obj, dict):
-        out: Dict[str, Any] = {}
-        for k, v in obj.items():
-            try:
-                key = str(k)
-            except Exception:
-                key = "<unstringable_key>"
-            out[key] = _json_safe(v, str_limit=str_limit, depth=depth + 1, max_depth=max_depth)
-        return out
+        return _JSON_KIND_DICT, obj
 
     # iterables
     if isinstance(obj, (list, tuple, set)):
-        return [
-            _json_safe(v, str_limit=str_limit, depth=depth + 1, max_depth=max_depth)
-            for v in list(obj)
-        ]
+        return _JSON_KIND_SEQ, obj
 
     # Enum-like
     val = getattr(obj, "value", None)
     if val is not None and isinstance(val, (str, int, float, bool)):
-        return val
+        return _JSON_KIND_LEAF, val
 
     # fallback
-    return _truncate_str(str(obj), str_limit)
+    return _JSON_KIND_LEAF, _truncate_str(str(obj), str_limit)
+
+
+def _json_safe(obj: Any, *, str_limit: int = 4096, depth: int = 0, max_depth: int = 20) -> Any:
+    """
+    Convert arbitrary objects into JSON-serializable structures.
+
+    Policy (v0.1):
+      - dict/list/tuple/set -> recursively convert
+      - dataclass -> asdict then convert
+      - Enum -> value if present else str()
+      - datetime -> ISO string (UTC if tz-aware is missing, keep as-is but strftime safe)
+      - bytes -> hex digest-like preview
+      - unknown -> str(obj) truncated
+
+    Max depth prevents pathological recursion.
+
+    The walk uses an explicit stack instead of recursion: each entry is
+    (parent container, key/index, value, depth), and the converted value
+    is stored into its parent when the entry is popped.
+    """
+    root: List[Any] = [None]
+    stack: List[Tuple[Any, Any, Any, int]] = [(root, 0, obj, depth)]
+    push = stack.append
+    pop = stack.pop
+    leaf_get = _JSON_LEAF.get
+    seq_types = _JSON_SEQ_TYPES
+
+    while stack:
+        parent, key, value, d = pop()
+        if d > max_depth:
+            parent[key] = "<max_depth_reached>"
+            continue
+
+        t = type(value)
+        fn = leaf_get(t)
+        if fn is not None:
+            parent[key] = fn(value, str_limit)
+            continue
+
+        if t is dict:
+            kind = _JSON_KIND_DICT
+        elif t in seq_types:
+            kind = _JSON_KIND_SEQ
+        else:
+            kind, value = _json_classify(value, str_limit)
+            if kind == _JSON_KIND_LEAF:
+                parent[key] = value
+                continue
+            if kind == _JSON_KIND_NESTED:
+                push((parent, key, value, d + 1))
+                continue
+
+        child_depth = d + 1
+        if kind == _JSON_KIND_DICT:
+            out: Dict[str, Any] = {}
+            items = []
+            for k, v in value.items():
+                try:
+                    sk = str(k)
+                except Exception:
+                    sk = "<unstringable_key>"
+                out[sk] = None
+                items.append((out, sk, v, child_depth))
+            parent[key] = out
+        else:
+            values = list(value)
+            out_list: List[Any] = [None] * len(values)
+            items = [(out_list, i, v, child_depth) for i, v in enumerate(values)]
+            parent[key] = out_list
+        # reversed so children are converted (and later duplicates win) in order
+        items.reverse()
+        stack.extend(items)
+
+    return root[0]
 
 
 def _ensure_parent_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+_ORJSON_SCALAR_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def _orjson_native(obj: Any, max_depth: int = 20) -> bool:
+    """
+    True if orjson output for obj is byte-identical to _json_safe + json.
+
+    That holds for plain dicts (str keys) and lists of str/int/bool/None and
+    floats that repr() writes without an exponent, nested at most max_depth
+    deep (_json_safe's limit). Anything else (NaN/Infinity, which orjson
+    writes as null; exponent floats, "1e+16" vs "1e16"; datetimes,
+    dataclasses, tuples, non-str keys, ...) needs the _json_safe path.
+    Read-only walk: no copies are made.
+    """
+    scalars = _ORJSON_SCALAR_TYPES
+    stack: List[Tuple[Any, int]] = [([obj], -1)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        # container, depth of the container itself; its children are at d + 1
+        container, d = pop()
+        child_depth = d + 1
+        if child_depth > max_depth:
+            return False
+        if type(container) is dict:
+            for k in container:
+                if type(k) is not str:
+                    return False
+            values = container.values()
+        else:
+            values = container
+        for value in values:
+            t = type(value)
+            if t in scalars:
+                continue
+            if t is float:
+                # also rejects NaN (all comparisons false) and +-Infinity
+                if value != 0.0 and not (1e-4 <= abs(value) < 1e16):
+                    return False
+            elif t is dict or t is list:
+                push((value, child_depth))
+            else:
+                return False
+    return True
+
+
+def _orjson_dumps(raw: Any, *, pretty: bool, ensure_ascii: bool) -> Optional[bytes]:
+    """
+    Serialize raw report data with orjson (newline-terminated UTF-8).
+
+    Only used when raw is already JSON-native (see _orjson_native), so the
+    bytes match the _json_safe + stdlib json path exactly and the tree copy
+    is skipped. Returns None to use that path instead: orjson is missing,
+    ensure_ascii is requested (orjson has no such mode), the data is not
+    JSON-native, or orjson rejects it (ints beyond 64 bits, lone surrogates).
+    """
+    if orjson is None or ensure_ascii or not _orjson_native(raw):
+        return None
+    option = orjson.OPT_APPEND_NEWLINE
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(raw, option=option)
+    except TypeError:  # orjson.JSONEncodeError
+        return None
+
+
 def write_audit_json(
     report: Any,
     out_path: str | os.PathLike[str],
@@ -137,11 +332,18 @@ def write_audit_json(
         if callable(to_dict):
             raw = to_dict()
         elif is_dataclass(report):
-            raw = asdict(report)
+            raw = _shallow_asdict(report)
         else:
             # last resort
             raw = {"report": report}
 
+    data = _orjson_dumps(raw, pretty=pretty, ensure_ascii=ensure_ascii)
+    if data is not None:
+        with p.open("wb") as f:
+            f.write(data)
+        # raw is JSON-native (checked by _orjson_dumps): it is what was written
+        return raw
+
     safe = _json_safe(raw, str_limit=str_limit)
 
     with p.open("w", encoding="utf-8") as f:
@@ -172,10 +374,14 @@ def dumps_audit_json(
         if callable(to_dict):
             raw = to_dict()
         elif is_dataclass(report):
-            raw = asdict(report)
+            raw = _shallow_asdict(report)
         else:
             raw = {"report": report}
 
+    data = _orjson_dumps(raw, pretty=pretty, ensure_ascii=ensure_ascii)
+    if data is not None:
+        return data.decode("utf-8")
+
     safe = _json_safe(raw, str_limit=str_limit)
 
     if pretty:
@@ -218,7 +424,7 @@ def write_audit_jsonl(
         if callable(to_dict):
             report_dict = to_dict()
         elif is_dataclass(report):
-            report_dict = asdict(report)
+            report_dict = _shallow_asdict(report)
         else:
             report_dict = {"report": report}
     
@@ -7,11 +7,24 @@ Loads rulesets from YAML files on disk
 
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from collections import OrderedDict
 from pathlib import Path
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
 import yaml
 import re
 
+try:
+    # LibYAML C parser; same semantics as SafeLoader, much faster
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from failcore.core.rules.loader import RuleSetLoader
 from failcore.core.rules.models import (
     RuleSet,
@@ -27,6 +40,40 @@ from failcore.core.rules.models import (
 )
 
 
+# YAML "flags" letters -> re flags
+_FLAG_MAP = {
+    "i": re.IGNORECASE,
+    "m": re.MULTILINE,
+    "s": re.DOTALL,
+}
+
+
+# Parsed rulesets shared by all loaders, keyed by (path, mtime_ns, size).
+# Values are pickled RuleSets so every load gets its own objects
+# (registries mutate rule.enabled). The pickles never leave this process.
+_PARSED_CACHE_MAXSIZE = 100
+_parsed_cache: "OrderedDict[Tuple[str, int, int], bytes]" = OrderedDict()
+_parsed_cache_lock = threading.Lock()
+
+# Sidecars hold the YAML document as plain JSON (never pickle: the file sits
+# next to the ruleset and loading it must not be able to run code), tagged
+# with the sha256 of the YAML bytes it was parsed from.
+# Bump when the sidecar layout changes, to invalidate old sidecars.
+_SIDECAR_VERSION = 2
+
+
+def _sidecar_path(file_path: Path) -> Path:
+    return file_path.with_name(file_path.name + ".cache")
+
+
+def _parse_flags(flags: str) -> int:
+    """Convert a flag string such as "im" to re flags (unknown letters ignored)"""
+    flag_value = 0
+    for c in set(flags.lower()):
+        flag_value |= _FLAG_MAP.get(c, 0)
+    return flag_value
+
+
 class FileSystemLoader(RuleSetLoader):
     """
     Load rulesets from YAML files
@@ -53,14 +100,18 @@ class FileSystemLoader(RuleSetLoader):
                 value: "sk-[A-Za-z0-9]{32,}"
     """
     
-    def __init__(self, base_path: str | Path):
+    def __init__(self, base_path: str | Path, disk_cache: bool = False):
         """
         Initialize filesystem loader
         
         Args:
             base_path: Base directory containing ruleset YAML files
+            disk_cache: Also keep the parsed YAML in "{name}.yml.cache" JSON
+                sidecars next to the YAML files, so later processes skip
+                YAML parsing while the file's content hash is unchanged
         """
         self.base_path = Path(base_path).expanduser().resolve()
+        self.disk_cache = disk_cache
         self._cache: Dict[str, RuleSet] = {}
     
     def load_ruleset(self, name: str) -> Optional[RuleSet]:
@@ -90,17 +141,106 @@ class FileSystemLoader(RuleSetLoader):
         if not file_path:
             return None
         
+        data = None
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            st = file_path.stat()
+            key = (str(file_path), st.st_mtime_ns, st.st_size)
             
-            ruleset = self._parse_ruleset(data)
-            self._cache[name] = ruleset
-            return ruleset
+            ruleset = self._load_cached(key, file_path)
+            if ruleset is None:
+                with open(file_path, "rb") as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+                    f.seek(0)
+                    # Parse from the file object so YAML error marks name the file
+                    data = yaml.load(f, Loader=_YamlLoader)
+                
+                ruleset = self._parse_ruleset(data)
         
         except Exception as e:
             print(f"Error loading ruleset {name}: {e}")
             return None
+        
+        if data is not None:
+            # Best effort: a failure here never fails the load
+            self._store_cached(key, file_path, digest, data, ruleset)
+        
+        self._cache[name] = ruleset
+        return ruleset
+    
+    def _load_cached(self, key: Tuple[str, int, int], file_path: Path) -> Optional[RuleSet]:
+        """Parsed ruleset from the in-memory LRU or the disk sidecar, if still valid"""
+        with _parsed_cache_lock:
+            blob = _parsed_cache.get(key)
+            if blob is not None:
+                _parsed_cache.move_to_end(key)
+        if blob is not None:
+            return pickle.loads(blob)
+        
+        if not self.disk_cache:
+            return None
+        try:
+            with open(file_path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            with open(_sidecar_path(file_path), "r", encoding="utf-8") as f:
+                sidecar = json.load(f)
+            if sidecar.get("version") != _SIDECAR_VERSION or sidecar.get("sha256") != digest:
+                return None
+            ruleset = self._parse_ruleset(sidecar["data"])
+        except Exception:
+            # Missing, stale or unreadable sidecar: parse YAML instead
+            return None
+        self._remember(key, ruleset)
+        return ruleset
+    
+    def _store_cached(
+        self,
+        key: Tuple[str, int, int],
+        file_path: Path,
+        digest: str,
+        data: Any,
+        ruleset: RuleSet,
+    ) -> None:
+        """Remember a freshly parsed ruleset (and write its sidecar)"""
+        self._remember(key, ruleset)
+        
+        if not self.disk_cache:
+            return
+        try:
+            payload = json.dumps({"version": _SIDECAR_VERSION, "sha256": digest, "data": data})
+            # Only documents that survive a JSON round trip unchanged
+            # (no timestamps, non-string keys, NaN, ...) get a sidecar
+            if json.loads(payload)["data"] != data:
+                return
+        except (TypeError, ValueError):
+            return
+        
+        sidecar = _sidecar_path(file_path)
+        try:
+            # Write to a temp file and rename, so readers never see a partial sidecar
+            fd, tmp = tempfile.mkstemp(dir=sidecar.parent, prefix=sidecar.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp, sidecar)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            # Read-only ruleset directory: the in-memory cache still applies
+            pass
+    
+    @staticmethod
+    def _remember(key: Tuple[str, int, int], ruleset: RuleSet) -> None:
+        try:
+            blob = pickle.dumps(ruleset, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Unpicklable rule content: skip the in-memory cache for this file
+            return
+        with _parsed_cache_lock:
+            _parsed_cache[key] = blob
+            _parsed_cache.move_to_end(key)
+            while len(_parsed_cache) > _PARSED_CACHE_MAXSIZE:
+                _parsed_cache.popitem(last=False)
     
     def list_available_rulesets(self) -> List[str]:
         """List all available ruleset names"""
@@ -119,6 +259,19 @@ class FileSystemLoader(RuleSetLoader):
     def reload(self) -> None:
         """Reload all rulesets from disk"""
         self._cache.clear()
+        
+        base = str(self.base_path) + os.sep
+        with _parsed_cache_lock:
+            for key in [k for k in _parsed_cache if k[0].startswith(base)]:
+                del _parsed_cache[key]
+        
+        if self.disk_cache and self.base_path.exists():
+            for pattern in ("*.yml.cache", "*.yaml.cache"):
+                for sidecar in self.base_path.glob(pattern):
+                    try:
+                        sidecar.unlink()
+                    except OSError:
+                        pass
     
     def _parse_ruleset(self, data: Dict[str, Any]) -> RuleSet:
         """Parse ruleset from YAML data"""
@@ -207,15 +360,10 @@ class FileSystemLoader(RuleSetLoader):
             
             # Parse regex flags
             if isinstance(flags, str):
-                flag_value = 0
-                if "i" in flags.lower():
-                    flag_value |= re.IGNORECASE
-                if "m" in flags.lower():
-                    flag_value |= re.MULTILINE
-                if "s" in flags.lower():
-                    flag_value |= re.DOTALL
-                flags = flag_value
+                flags = _parse_flags(flags)
             
+            # Pattern compiles regex values once here (Pattern.compiled),
+            # so scans only call compiled.search()
             return Pattern(
                 pattern_type=pattern_type,
                 value=value,
@@ -4,10 +4,178 @@ Trace ingestor - converts trace.jsonl to database
 """
 
 import json
-from typing import Dict, Any, Optional
-from collections import defaultdict
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from collections import OrderedDict, defaultdict
 from .trace import SQLiteStore
 
+try:
+    import orjson  # optional fast path: pip install failcore[fast]
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Raw events buffered per executemany() insert
+_INSERT_BATCH_SIZE = 1000
+
+
+# Event types TraceIngestor._process_event aggregates into steps
+_STEP_EVENT_TYPES = frozenset({
+    "STEP_START", "STEP_END", "POLICY_DENIED", "OUTPUT_NORMALIZED", "VALIDATION_FAILED",
+})
+
+
+def _intern(value: Any) -> Any:
+    """sys.intern() for str values, others pass through"""
+    return sys.intern(value) if type(value) is str else value
+
+
+# steps.kind for aggregated trace steps (every step event is a tool call)
+_STEP_KIND = "tool"
+
+
+class _StepAgg:
+    """
+    Step aggregation entry in TraceIngestor.step_cache
+    
+    Slots instead of a per-step dict; as_row() maps the aggregate onto
+    the steps table columns.
+    """
+    
+    __slots__ = (
+        "run_id", "step_id", "tool", "attempt",
+        "start_seq", "start_ts", "end_seq", "end_ts",
+        "status", "phase", "duration_ms", "fingerprint_id",
+        "error_code", "error_message", "warnings",
+        "has_policy_denied", "has_output_normalized",
+    )
+    
+    def __init__(self, run_id: str, step_id: str, tool: str, attempt: int):
+        self.run_id = run_id
+        self.step_id = step_id
+        self.tool = tool
+        self.attempt = attempt
+        self.warnings: Any = []
+        self.has_policy_denied = 0
+        self.has_output_normalized = 0
+    
+    def as_row(self) -> Dict[str, Any]:
+        """
+        Steps row for SQLiteStore.upsert_steps()
+        
+        Every column is present (None when no event set it), so a whole
+        flush shares one column set and one batched upsert. Fields without
+        a steps column (phase, warnings, flags) go into payload_json.
+        """
+        return {
+            "run_id": self.run_id,
+            "step_id": self.step_id,
+            "name": self.tool,
+            "kind": _STEP_KIND,
+            "attempt": self.attempt,
+            "start_seq": getattr(self, "start_seq", None),
+            "end_seq": getattr(self, "end_seq", None),
+            "started_at": getattr(self, "start_ts", None),
+            "finished_at": getattr(self, "end_ts", None),
+            "duration_ms": getattr(self, "duration_ms", None),
+            "status": getattr(self, "status", None),
+            "error_code": getattr(self, "error_code", None),
+            "error_message": getattr(self, "error_message", None),
+            "fingerprint": getattr(self, "fingerprint_id", None),
+            "payload_json": {
+                "phase": getattr(self, "phase", None),
+                "warnings": self.warnings or None,
+                "has_policy_denied": self.has_policy_denied,
+                "has_output_normalized": self.has_output_normalized,
+            },
+        }
+
+
+def _iter_trace_lines(trace_path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Yield the raw lines of a trace file (without the trailing newline).
+    
+    The file is memory-mapped and split with mmap.find(), so each line is
+    a single slice copy instead of a buffered readline() call.
+    start/stop restrict the scan to a byte range; start must be 0 or
+    just after a newline.
+    """
+    with open(trace_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return
+        with mm:
+            find = mm.find
+            size = len(mm) if stop is None else min(stop, len(mm))
+            while start < size:
+                end = find(b"\n", start, size)
+                if end == -1:
+                    end = size
+                yield mm[start:end]
+                start = end + 1
+
+
+def _chunk_bounds(trace_path: str, chunks: int) -> List[Tuple[int, int]]:
+    """Split a file into up to `chunks` byte ranges that end on newlines"""
+    size = os.path.getsize(trace_path)
+    if size == 0:
+        return []
+    bounds = [0]
+    with open(trace_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for i in range(1, chunks):
+                pos = max(size * i // chunks, bounds[-1])
+                nl = mm.find(b"\n", pos)
+                if nl == -1:
+                    break
+                if nl + 1 > bounds[-1]:
+                    bounds.append(nl + 1)
+    if bounds[-1] < size:
+        bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _slim_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The parts of an event ingest_file needs after its row is built:
+    ts, run (metadata) and, for step events, what _process_event reads.
+    """
+    slim = {"ts": event.get("ts"), "run": event.get("run", {})}
+    evt = event.get("event", {})
+    evt_type = evt.get("type")
+    if evt_type in _STEP_EVENT_TYPES:
+        data = evt.get("data", {})
+        if isinstance(data, dict):
+            data = {k: data[k] for k in ("result", "normalize") if k in data}
+        slim["seq"] = event.get("seq")
+        slim["event"] = {"type": evt_type, "step": evt.get("step", {}), "data": data}
+    return slim
+
+
+def _parse_chunk(trace_path: str, start: int, stop: int, compress: bool = False) -> Tuple[List[Tuple[Dict[str, Any], tuple]], int]:
+    """
+    Process-pool worker: parse a byte range of the trace.
+    
+    Returns ([(slim event, events row), ...] in file order, error count).
+    """
+    items = []
+    errors = 0
+    event_row = SQLiteStore.event_row
+    for line in _iter_trace_lines(trace_path, start, stop):
+        if not line or line.isspace():
+            continue
+        try:
+            event = _json_loads(line)
+            items.append((_slim_event(event), event_row(event, line, compress)))
+        except Exception:
+            errors += 1
+    return items, errors
+
 
 class TraceIngestor:
     """
@@ -20,17 +188,65 @@ class TraceIngestor:
     - OUTPUT_NORMALIZED -> step.has_output_normalized = 1, warnings
     """
     
+    # Bulk-ingest tuning on top of SQLiteStore.DEFAULT_PRAGMAS (journal
+    # mode, sync level etc. are the store's): 256 MiB page cache.
+    # Applied for the duration of ingest_file() only; the connection is the
+    # store's and may be shared.
+    _INGEST_PRAGMAS = {
+        "cache_size": -262144,
+    }
+    
     def __init__(self, store: SQLiteStore):
         self.store = store
-        self.step_cache: Dict[tuple, Dict[str, Any]] = {}  # (run_id, step_id, attempt) -> step_data
+        self.step_cache: Dict[tuple, _StepAgg] = {}  # (run_id, step_id, attempt) -> step aggregate
+        
+        # Early step flushing (ingest_file(flush_after=N)): ended step key ->
+        # event count at its STEP_END, and keys already written out
+        self._ended: Optional["OrderedDict[tuple, int]"] = None
+        self._flushed: set = set()
+        self._event_count = 0
+        
+        # Event type -> aggregation handler (keys match _STEP_EVENT_TYPES)
+        self._handlers = {
+            "STEP_START": self._on_step_start,
+            "STEP_END": self._on_step_end,
+            "POLICY_DENIED": self._on_policy_denied,
+            "OUTPUT_NORMALIZED": self._on_output_normalized,
+            "VALIDATION_FAILED": self._on_validation_failed,
+        }
+    
+    def _set_pragmas(self, pragmas: Dict[str, Any]) -> Dict[str, Any]:
+        """Set connection pragmas, returning their previous values"""
+        conn = self.store.conn
+        previous = {}
+        for name, value in pragmas.items():
+            previous[name] = conn.execute(f"PRAGMA {name}").fetchone()[0]
+            conn.execute(f"PRAGMA {name}={value}")
+        return previous
     
-    def ingest_file(self, trace_path: str, skip_if_exists: bool = False) -> Dict[str, int]:
+    def ingest_file(
+        self,
+        trace_path: str,
+        skip_if_exists: bool = False,
+        workers: int = 1,
+        flush_after: Optional[int] = None,
+    ) -> Dict[str, int]:
         """
         Ingest trace file into database
         
         Args:
             trace_path: Path to trace.jsonl
             skip_if_exists: If True, skip if run_id already exists
+            workers: Parse with this many worker processes (1 = in-process).
+                Workers parse newline-aligned byte ranges and build event
+                rows; aggregation and inserts stay in this process, in file
+                order. Only worth it for large traces; callers must be
+                safe to use with multiprocessing (e.g. a __main__ guard).
+            flush_after: Write a step out once this many events have passed
+                since its STEP_END, instead of holding every step until EOF.
+                Keeps memory at O(steps in flight) for very large traces.
+                Step events arriving later than that for a written-out step
+                are ignored.
         
         Returns:
             Statistics: {"events": count, "steps": count, "errors": count, "skipped": bool}
@@ -63,36 +279,32 @@ class TraceIngestor:
             "total_steps": 0,
         }
         
-        # Read first event to get run_id
-        with open(trace_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        event = json.loads(line)
-                        run = event.get("run", {})
-                        run_metadata["run_id"] = run.get("run_id")
-                        break
-                    except:
-                        pass
-        
-        # Check if run already exists
-        if skip_if_exists and run_metadata["run_id"]:
-            cursor = self.store.conn.cursor()
-            cursor.execute("SELECT 1 FROM runs WHERE run_id = ?", (run_metadata["run_id"],))
-            if cursor.fetchone():
-                stats["skipped"] = True
-                return stats
+        # One write transaction for the whole file (committed by upsert_run/commit below)
+        conn = self.store.conn
+        began = not conn.in_transaction
+        if began:
+            conn.execute("BEGIN IMMEDIATE")
+        saved_pragmas = self._set_pragmas(self._INGEST_PRAGMAS)
         
-        # Read and process events
-        with open(trace_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                
+        try:
+            self._ended = OrderedDict() if flush_after else None
+            self._flushed = set()
+            self._event_count = 0
+            
+            # Read and process events in file order
+            pending: List[tuple] = []
+            run_id_seen = False
+            for event, row in self._iter_events(trace_path, workers, stats):
                 try:
-                    event = json.loads(line)
+                    # run_id comes from the first parsed event; check for an
+                    # existing run before anything is inserted
+                    if not run_id_seen:
+                        run_metadata["run_id"] = event.get("run", {}).get("run_id")
+                        run_id_seen = True
+                        if skip_if_exists and run_metadata["run_id"] and self._run_exists(run_metadata["run_id"]):
+                            if began:
+                                conn.rollback()
+                            return {"events": 0, "steps": 0, "errors": 0, "incomplete": 0, "skipped": True}
                     
                     # Extract run metadata from first event
                     if not run_metadata["created_at"]:
@@ -131,48 +343,150 @@ class TraceIngestor:
                     run_metadata["last_event_ts"] = event.get("ts")
                     run_metadata["total_events"] += 1
                     
-                    # Insert raw event
-                    self.store.insert_event(event)
-                    stats["events"] += 1
+                    # Queue raw event for batched insert (counted once written)
+                    pending.append(row)
+                    if len(pending) >= _INSERT_BATCH_SIZE:
+                        self._write_event_rows(pending, stats)
                     
                     # Process for step aggregation
+                    self._event_count += 1
                     self._process_event(event)
+                    if flush_after and self._event_count % flush_after == 0:
+                        self._flush_ended(flush_after, stats)
                     
-                except json.JSONDecodeError:
-                    stats["errors"] += 1
                 except Exception as e:
                     stats["errors"] += 1
+            
+            self._write_event_rows(pending, stats)
+            
+            # Flush step cache to database
+            self._flush_steps(self.step_cache.values(), stats)
+            self._ended = None
+            
+            run_metadata["total_steps"] = stats["steps"]
+            
+            # Upsert run metadata
+            if run_metadata["run_id"]:
+                self.store.upsert_run(run_metadata["run_id"], run_metadata)
+            
+            self.store.commit()
+        except BaseException:
+            # Don't leave the database write-locked on this connection
+            if began:
+                conn.rollback()
+            raise
+        finally:
+            self._set_pragmas(saved_pragmas)
+        
+        # Bulk load changed table sizes; let the planner pick up the
+        # covering indexes
+        self.store.optimize()
+        
+        return stats
+    
+    def _iter_events(self, trace_path: str, workers: int, stats: Dict[str, int]) -> Iterator[Tuple[Dict[str, Any], tuple]]:
+        """
+        Yield (event, events row) in file order.
+        
+        Lines that fail to parse are counted in stats["errors"]. Rows keep
+        the source line as payload_json. With workers > 1, events are
+        slimmed (see _slim_event) and rows are built by the worker processes.
+        """
+        compress = self.store.compress_payloads
+        if workers <= 1:
+            event_row = self.store.event_row
+            # Bytes lines: the JSON parser skips surrounding whitespace,
+            # so only blank lines need filtering
+            for line in _iter_trace_lines(trace_path):
+                if not line or line.isspace():
+                    continue
+                try:
+                    event = _json_loads(line)
+                    row = event_row(event, line, compress)
+                except Exception:
+                    stats["errors"] += 1
+                    continue
+                yield event, row
+            return
+        
+        bounds = _chunk_bounds(trace_path, workers)
+        if not bounds:
+            return
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(bounds)))
+        try:
+            starts = [b[0] for b in bounds]
+            stops = [b[1] for b in bounds]
+            for items, errors in executor.map(_parse_chunk, [trace_path] * len(bounds), starts, stops, [compress] * len(bounds)):
+                stats["errors"] += errors
+                yield from items
+        finally:
+            # Also reached when the caller stops early (skip_if_exists)
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _write_event_rows(self, pending: List[tuple], stats: Dict[str, int]):
+        """
+        Insert and clear a batch of events rows.
         
-        # Flush step cache to database
-        for step_data in self.step_cache.values():
+        If the batch fails, it is retried row by row so one unbindable row
+        is a single error and the rest are still written. Rows already
+        written by the failed batch are skipped by INSERT OR IGNORE.
+        """
+        try:
+            self.store.insert_event_rows(pending)
+            stats["events"] += len(pending)
+        except Exception:
+            for row in pending:
+                try:
+                    self.store.insert_event_rows([row])
+                    stats["events"] += 1
+                except Exception:
+                    stats["errors"] += 1
+        finally:
+            pending.clear()
+    
+    def _flush_steps(self, aggs: Iterable[_StepAgg], stats: Dict[str, int]):
+        """Finalize step aggregates and upsert them"""
+        steps = []
+        for agg in aggs:
             # Check if step is incomplete (missing START or END)
-            if not step_data.get("start_ts") or not step_data.get("end_ts"):
-                step_data["status"] = "INCOMPLETE"
+            if not getattr(agg, "start_ts", None) or not getattr(agg, "end_ts", None):
+                agg.status = "INCOMPLETE"
                 stats["incomplete"] += 1
             
-            self.store.upsert_step(step_data)
+            steps.append(agg.as_row())
             stats["steps"] += 1
         
-        run_metadata["total_steps"] = stats["steps"]
-        
-        # Upsert run metadata
-        if run_metadata["run_id"]:
-            self.store.upsert_run(run_metadata["run_id"], run_metadata)
-        
-        self.store.commit()
-        
-        return stats
+        self.store.upsert_steps(steps)
+    
+    def _flush_ended(self, flush_after: int, stats: Dict[str, int]):
+        """Write out and drop steps whose STEP_END is flush_after+ events old"""
+        cutoff = self._event_count - flush_after
+        ended = self._ended
+        aggs = []
+        while ended:
+            key, seen_at = next(iter(ended.items()))
+            if seen_at > cutoff:
+                break
+            del ended[key]
+            aggs.append(self.step_cache.pop(key))
+            self._flushed.add(key)
+        if aggs:
+            self._flush_steps(aggs, stats)
+    
+    def _run_exists(self, run_id: str) -> bool:
+        """Check if run already exists"""
+        cursor = self.store.conn.cursor()
+        cursor.execute("SELECT 1 FROM runs WHERE run_id = ?", (run_id,))
+        return cursor.fetchone() is not None
     
     def _process_event(self, event: Dict[str, Any]):
         """Process event for step aggregation"""
         evt = event.get("event", {})
-        evt_type = evt.get("type")
         
-        if not evt_type:
-            return
-        
-        # Only process step-related events
-        if evt_type not in ("STEP_START", "STEP_END", "POLICY_DENIED", "OUTPUT_NORMALIZED", "VALIDATION_FAILED"):
+        # Only step-related events have a handler
+        evt_type = evt.get("type")
+        handler = self._handlers.get(evt_type)
+        if handler is None:
             return
         
         step = evt.get("step", {})
@@ -180,81 +494,73 @@ class TraceIngestor:
         if not step_id:
             return
         
-        run_id = event.get("run", {}).get("run_id", "unknown")
-        tool = step.get("tool", "")
+        # Repeated across every step of a run: share one string object
+        run_id = _intern(event.get("run", {}).get("run_id", "unknown"))
+        tool = _intern(step.get("tool", ""))
         attempt = step.get("attempt", 1)
         
         key = (run_id, step_id, attempt)
+        if key in self._flushed:
+            return
         
         # Get or create step entry
-        if key not in self.step_cache:
-            self.step_cache[key] = {
-                "run_id": run_id,
-                "step_id": step_id,
-                "tool": tool,
-                "attempt": attempt,
-                "warnings": None,
-                "has_policy_denied": 0,
-                "has_output_normalized": 0,
-            }
+        agg = self.step_cache.get(key)
+        if agg is None:
+            agg = self.step_cache[key] = _StepAgg(run_id, step_id, tool, attempt)
         
-        step_data = self.step_cache[key]
+        handler(agg, event, evt, step)
         
-        # Process by event type
-        if evt_type == "STEP_START":
-            step_data["start_seq"] = event.get("seq")
-            step_data["start_ts"] = event.get("ts")
-            
-            # Extract fingerprint
-            fingerprint = step.get("fingerprint", {})
-            if fingerprint:
-                step_data["fingerprint_id"] = fingerprint.get("id")
+        if self._ended is not None and evt_type == "STEP_END":
+            # (Re)start the flush clock for this step
+            self._ended.pop(key, None)
+            self._ended[key] = self._event_count
+    
+    def _on_step_start(self, agg: _StepAgg, event: Dict[str, Any], evt: Dict[str, Any], step: Dict[str, Any]):
+        agg.start_seq = event.get("seq")
+        agg.start_ts = event.get("ts")
         
-        elif evt_type == "STEP_END":
-            step_data["end_seq"] = event.get("seq")
-            step_data["end_ts"] = event.get("ts")
-            
-            data = evt.get("data", {})
-            result = data.get("result", {})
-            
-            step_data["status"] = result.get("status")
-            step_data["phase"] = result.get("phase")
-            step_data["duration_ms"] = result.get("duration_ms")
-            
-            # Extract error
-            error = result.get("error")
-            if error:
-                step_data["error_code"] = error.get("code")
-                step_data["error_message"] = error.get("message")
-            
-            # Extract warnings
-            warnings = result.get("warnings")
-            if warnings:
-                step_data["warnings"] = json.dumps(warnings)
+        # Extract fingerprint
+        fingerprint = step.get("fingerprint", {})
+        if fingerprint:
+            agg.fingerprint_id = fingerprint.get("id")
+    
+    def _on_step_end(self, agg: _StepAgg, event: Dict[str, Any], evt: Dict[str, Any], step: Dict[str, Any]):
+        agg.end_seq = event.get("seq")
+        agg.end_ts = event.get("ts")
+        
+        data = evt.get("data", {})
+        result = data.get("result", {})
         
-        elif evt_type == "POLICY_DENIED":
-            step_data["has_policy_denied"] = 1
-            # Mark as blocked if not already set
-            if not step_data.get("status"):
-                step_data["status"] = "BLOCKED"
-                step_data["phase"] = "policy"
+        agg.status = _intern(result.get("status"))
+        agg.phase = _intern(result.get("phase"))
+        agg.duration_ms = result.get("duration_ms")
         
-        elif evt_type == "OUTPUT_NORMALIZED":
-            step_data["has_output_normalized"] = 1
-            data = evt.get("data", {})
-            normalize = data.get("normalize", {})
-            if normalize.get("decision") == "mismatch":
-                # Add to warnings
-                warnings = []
-                if step_data.get("warnings"):
-                    warnings = json.loads(step_data["warnings"])
-                warnings.append("OUTPUT_KIND_MISMATCH")
-                step_data["warnings"] = json.dumps(warnings)
+        # Extract error
+        error = result.get("error")
+        if error:
+            agg.error_code = error.get("code")
+            agg.error_message = error.get("message")
         
-        elif evt_type == "VALIDATION_FAILED":
-            # Add validation failure to warnings
-            warnings = []
-            if step_data.get("warnings"):
-                warnings = json.loads(step_data["warnings"])
-            warnings.append("VALIDATION_FAILED")
-            step_data["warnings"] = json.dumps(warnings)
+        # Extract warnings
+        warnings = result.get("warnings")
+        if warnings:
+            agg.warnings = warnings
+    
+    def _on_policy_denied(self, agg: _StepAgg, event: Dict[str, Any], evt: Dict[str, Any], step: Dict[str, Any]):
+        agg.has_policy_denied = 1
+        # Mark as blocked if not already set
+        if not getattr(agg, "status", None):
+            agg.status = "BLOCKED"
+            agg.phase = "policy"
+    
+    def _on_output_normalized(self, agg: _StepAgg, event: Dict[str, Any], evt: Dict[str, Any], step: Dict[str, Any]):
+        agg.has_output_normalized = 1
+        data = evt.get("data", {})
+        normalize = data.get("normalize", {})
+        if normalize.get("decision") == "mismatch":
+            # Add to warnings
+            agg.warnings.append("OUTPUT_KIND_MISMATCH")
+    
+    def _on_validation_failed(self, agg: _StepAgg, event: Dict[str, Any], evt: Dict[str, Any], step: Dict[str, Any]):
+        # Add validation failure to warnings
+        agg.warnings.append("VALIDATION_FAILED")
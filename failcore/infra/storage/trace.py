@@ -3,11 +3,124 @@
 SQLite storage engine for trace events
 """
 
+import queue
 import sqlite3
 import json
-from typing import Any, Dict, List, Optional
+import math
+import os
+import threading
+import zlib
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson  # optional fast path: pip install failcore[fast]
+except ImportError:
+    orjson = None
+
+
+# Read-only stand-in for missing sub-objects in event_row()
+_EMPTY: Dict[str, Any] = {}
+
+
+def _has_nonfinite(obj: Any) -> bool:
+    """True if a NaN/Infinity float is nested anywhere in dicts/lists/tuples"""
+    t = type(obj)
+    if t is dict:
+        obj = obj.values()
+    elif t is not list and t is not tuple:
+        return t is float and not math.isfinite(obj)
+    for value in obj:
+        t = type(value)
+        if t is float:
+            if not math.isfinite(value):
+                return True
+        elif (t is dict or t is list or t is tuple) and _has_nonfinite(value):
+            return True
+    return False
+
+
+def _json_dumps(obj: Any) -> str:
+    """
+    json.dumps() via orjson when available.
+    
+    Falls back to json.dumps() for values orjson rejects (non-str keys, ints
+    beyond 64 bits) and for NaN/Infinity, which orjson would silently write
+    as null where json.dumps() keeps NaN/Infinity.
+    """
+    if orjson is not None:
+        try:
+            if not _has_nonfinite(obj):
+                return orjson.dumps(obj).decode("utf-8")
+        except (TypeError, RecursionError):
+            pass
+    return json.dumps(obj)
+
+
+# INSERT ... ON CONFLICT ... DO UPDATE needs SQLite 3.24+
+_HAS_UPSERT = sqlite3.sqlite_version_info >= (3, 24, 0)
+
+# steps key (UNIQUE(run_id, step_id, attempt))
+_STEP_KEY_COLUMNS = ("run_id", "step_id", "attempt")
+
+# NOT NULL steps columns without defaults. The upsert's INSERT half is
+# checked against them even when it ends up updating, so partial updates
+# lacking any of these take the UPDATE-then-INSERT path instead.
+_STEP_REQUIRED_COLUMNS = frozenset({"run_id", "step_id", "name", "kind"})
+
+
+@lru_cache(maxsize=64)
+def _upsert_step_sql(columns: Tuple[str, ...]) -> str:
+    """Steps upsert statement for a column set (cached, so the text is reused)"""
+    updates = [f"{c} = excluded.{c}" for c in columns if c not in _STEP_KEY_COLUMNS]
+    conflict = f"DO UPDATE SET {', '.join(updates)}" if updates else "DO NOTHING"
+    return (
+        f"INSERT INTO steps ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' * len(columns))}) "
+        f"ON CONFLICT(run_id, step_id, attempt) {conflict}"
+    )
+
+
+@lru_cache(maxsize=64)
+def _update_step_sql(columns: Tuple[str, ...]) -> str:
+    """UPDATE of the given steps columns for one (run_id, step_id, attempt)"""
+    return (
+        f"UPDATE steps SET {', '.join(f'{c} = ?' for c in columns)} "
+        f"WHERE run_id = ? AND step_id = ? AND attempt = ?"
+    )
+
+
+@lru_cache(maxsize=64)
+def _insert_step_sql(columns: Tuple[str, ...]) -> str:
+    """Plain INSERT of the given steps columns"""
+    return f"INSERT INTO steps ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+
+
+@lru_cache(maxsize=256)
+def _row_dict_ctor(columns: Tuple[str, ...]):
+    """
+    Compiled `row tuple -> dict` builder for a result column list.
+    
+    A generated dict literal beats dict(sqlite3.Row) and dict(zip(...))
+    per row. Duplicate names map to their first column, like sqlite3.Row.
+    """
+    first: Dict[str, int] = {}
+    for i, name in enumerate(columns):
+        first.setdefault(name, i)
+    items = ", ".join(f"{name!r}: r[{i}]" for name, i in first.items())
+    return eval(f"lambda r: {{{items}}}")
+
+
+def _locked_write(method):
+    """Run a SQLiteStore write method under the store's write lock"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._write_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class SQLiteStore:
     """
@@ -21,18 +134,116 @@ class SQLiteStore:
     
     SCHEMA_VERSION = "0.1.3"
     
-    def __init__(self, db_path: str):
+    # Applied on connect(). WAL lets readers run during ingest and, with
+    # synchronous=NORMAL, fsyncs per checkpoint instead of per commit.
+    DEFAULT_PRAGMAS: Dict[str, Any] = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "mmap_size": 268435456,
+        "cache_size": -65536,
+        "busy_timeout": 30000,
+        "wal_autocheckpoint": 1000,
+        "analysis_limit": 1000,  # bounds the ANALYZE run by optimize()
+    }
+    
+    def __init__(
+        self,
+        db_path: str,
+        pragmas: Optional[Dict[str, Any]] = None,
+        compress_payloads: bool = False,
+        readers: int = 0,
+    ):
+        """
+        Args:
+            db_path: Database file path (or ":memory:")
+            pragmas: Overrides for DEFAULT_PRAGMAS; a None value skips that pragma
+            compress_payloads: Store new event payloads zlib-compressed in
+                payload_zlib (payload_json left empty); read them back
+                with decode_payload()
+            readers: Pool up to this many read-only connections for the
+                query methods and get_stats(), so reads don't queue behind
+                the writer (under WAL). They see committed data only.
+                With readers > 0 the store may be shared across threads;
+                `conn` stays the single writer, its write methods
+                serialized by a lock. Ignored for ":memory:".
+        """
         self.db_path = db_path
         self.conn: Optional[sqlite3.Connection] = None
+        self.pragmas = {**self.DEFAULT_PRAGMAS, **(pragmas or {})}
+        self.compress_payloads = compress_payloads
+        self._readers_max = readers if db_path != ":memory:" else 0
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._readers_open = 0
+        self._readers_lock = threading.Lock()
+        self._write_lock = threading.RLock()
     
     def connect(self):
         """Connect to database"""
-        self.conn = sqlite3.connect(self.db_path)
+        # Larger statement cache: get_stats() and per-column-set step
+        # upserts add to the ingest statements
+        self.conn = sqlite3.connect(
+            self.db_path, cached_statements=512, check_same_thread=not self._readers_max
+        )
         self.conn.row_factory = sqlite3.Row
+        self._apply_pragmas(self.conn)
         return self
     
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        """Apply self.pragmas (best effort: tuning never blocks opening)"""
+        in_memory = self.db_path == ":memory:"
+        for name, value in self.pragmas.items():
+            if value is None or (in_memory and name == "journal_mode"):
+                continue
+            try:
+                conn.execute(f"PRAGMA {name}={value}")
+            except sqlite3.DatabaseError:
+                # e.g. WAL on a read-only database
+                pass
+    
+    def _open_reader(self) -> sqlite3.Connection:
+        """Read-only connection to db_path (journal mode is the writer's)"""
+        uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, cached_statements=512, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn)
+        return conn
+    
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled read-only connection (the writer if no pool)"""
+        if not self._readers_max:
+            yield self.conn
+            return
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._readers_lock:
+                opening = self._readers_open < self._readers_max
+                if opening:
+                    self._readers_open += 1
+            if opening:
+                try:
+                    conn = self._open_reader()
+                except Exception:
+                    with self._readers_lock:
+                        self._readers_open -= 1
+                    raise
+            else:
+                conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
     def close(self):
         """Close database connection"""
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        self._readers_open = 0
         if self.conn:
             self.conn.close()
             self.conn = None
@@ -95,15 +306,22 @@ class SQLiteStore:
                 fingerprint TEXT,
                 source TEXT,
                 payload_json TEXT NOT NULL,
+                payload_zlib BLOB,
                 UNIQUE(run_id, seq),
                 UNIQUE(event_id)
             )
         """)
         
+        # payload_zlib was added after v0.1.3 shipped
+        if "payload_zlib" not in {row[1] for row in cursor.execute("PRAGMA table_info(events)")}:
+            cursor.execute("ALTER TABLE events ADD COLUMN payload_zlib BLOB")
+        
         # Create indexes for events (v0.1.3 optimized)
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_run_ts ON events(run_id, ts)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_run_type_ts ON events(run_id, type, ts)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_step_id ON events(step_id)")
+        # Partial: most events carry no step_id, and lookups are by value
+        cursor.execute("DROP INDEX IF EXISTS idx_events_step_id")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_step_id_nn ON events(step_id) WHERE step_id IS NOT NULL")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_fingerprint ON events(fingerprint)")
         
         # Steps table - aggregated step summary (v0.1.3)
@@ -137,6 +355,12 @@ class SQLiteStore:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_steps_kind ON steps(kind)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_steps_fingerprint ON steps(fingerprint)")
         
+        # Covering indexes for get_stats() GROUP BYs (index-only scans)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_steps_status ON steps(status) WHERE status IS NOT NULL")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_steps_run_kind ON steps(run_id, kind)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_steps_name ON steps(name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_steps_run_name ON steps(run_id, name)")
+        
         # Create indexes for runs (v0.1.3 optimized)
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs(created_at DESC)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_runs_mode_created ON runs(mode, created_at DESC)")
@@ -150,16 +374,15 @@ class SQLiteStore:
         
         self.conn.commit()
     
+    @_locked_write
     def upsert_run(self, run_id: str, run_data: Dict[str, Any]):
         """Insert or update run metadata (v0.1.3)"""
-        cursor = self.conn.cursor()
-        
         # Serialize tags as JSON if present
         tags = run_data.get("tags")
         if tags and not isinstance(tags, str):
             tags = json.dumps(tags)
         
-        cursor.execute("""
+        self.conn.execute("""
             INSERT OR REPLACE INTO runs 
             (run_id, created_at, mode, session_id, parent_run_id, workspace, sandbox_root, 
              trace_path, started_at, finished_at, status, client, tags, 
@@ -186,147 +409,278 @@ class SQLiteStore:
         ))
         self.conn.commit()
     
+    @_locked_write
     def insert_event(self, event: Dict[str, Any]):
         """Insert raw event (v0.1.3 envelope)"""
-        cursor = self.conn.cursor()
+        self.conn.execute(self._INSERT_EVENT_SQL, self.event_row(event, compress=self.compress_payloads))
+    
+    @_locked_write
+    def insert_events(self, events: Iterable[Dict[str, Any]]):
+        """
+        Insert many raw events in one write transaction.
+        
+        Takes the write lock upfront (BEGIN IMMEDIATE) and commits once.
+        Inside a transaction the caller already holds, rows are only
+        added to it and the caller commits.
+        """
+        event_row = self.event_row
+        compress = self.compress_payloads
+        rows = [event_row(event, compress=compress) for event in events]
+        if not rows:
+            return
+        if self.conn.in_transaction:
+            self.insert_event_rows(rows)
+            return
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.insert_event_rows(rows)
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+    
+    @_locked_write
+    def insert_event_rows(self, rows: List[tuple]):
+        """
+        Insert many events rows (from event_row()) with a single executemany.
         
-        # Extract envelope fields
-        run_id = event.get("run", {}).get("run_id", "unknown")
-        seq = event.get("seq", 0)
-        ts = event.get("ts", "")
+        Used for bulk ingest; the caller commits.
+        """
+        if not rows:
+            return
+        self.conn.executemany(self._INSERT_EVENT_SQL, rows)
+    
+    _INSERT_EVENT_SQL = """
+        INSERT OR IGNORE INTO events
+        (event_id, run_id, seq, ts, type, step_id, span_id, parent_span_id, 
+         severity, fingerprint, source, payload_json, payload_zlib)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    @staticmethod
+    def event_row(event: Dict[str, Any], raw: Optional[bytes] = None, compress: bool = False) -> tuple:
+        """
+        Build the events table row for a raw event (v0.1.3 envelope)
         
-        evt = event.get("event", {})
+        raw is the trace line `event` was parsed from; when given it is
+        stored as payload_json instead of re-serializing the event. With
+        compress, the payload goes to payload_zlib instead.
+        """
+        # Extract envelope fields (bound getters: this runs once per event)
+        get = event.get
+        run = get("run", _EMPTY)
+        run_id = run.get("run_id", "unknown")
+        seq = get("seq", 0)
+        ts = get("ts", "")
+        
+        evt = get("event", _EMPTY)
         evt_type = evt.get("type", "UNKNOWN")
         
         # Extract data fields (unified structure)
-        data = evt.get("data", {})
-        step_id = data.get("step_id")
-        fingerprint = data.get("fingerprint")
+        data_get = evt.get("data", _EMPTY).get
+        step_id = data_get("step_id")
+        fingerprint = data_get("fingerprint")
         
-        # Generate event_id if not present
-        event_id = event.get("event_id")
+        # Generate event_id if not present (8 random hex chars, as
+        # uuid4().hex[:8] gave, without building a UUID)
+        event_id = get("event_id")
         if not event_id:
-            import uuid
-            event_id = f"{run_id}:{seq}:{uuid.uuid4().hex[:8]}"
+            event_id = f"{run_id}:{seq}:{os.urandom(4).hex()}"
         
         # Optional fields
-        span_id = data.get("span_id")
-        parent_span_id = data.get("parent_span_id")
-        severity = event.get("severity", "info")
-        source = event.get("source") or event.get("run", {}).get("kind")
+        span_id = data_get("span_id")
+        parent_span_id = data_get("parent_span_id")
+        severity = get("severity", "info")
+        source = get("source") or run.get("kind")
         
         # Store full event as payload_json
-        payload_json = json.dumps(event)
+        payload_json = None
+        if raw is not None:
+            try:
+                payload_json = raw.decode("utf-8-sig").strip()
+            except UnicodeDecodeError:
+                pass
+        if payload_json is None:
+            payload_json = _json_dumps(event)
         
-        cursor.execute("""
-            INSERT OR IGNORE INTO events
-            (event_id, run_id, seq, ts, type, step_id, span_id, parent_span_id, 
-             severity, fingerprint, source, payload_json)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (event_id, run_id, seq, ts, evt_type, step_id, span_id, parent_span_id,
-              severity, fingerprint, source, payload_json))
+        payload_zlib = None
+        if compress:
+            payload_zlib = zlib.compress(payload_json.encode("utf-8"), 6)
+            payload_json = ""
+        
+        return (event_id, run_id, seq, ts, evt_type, step_id, span_id, parent_span_id,
+                severity, fingerprint, source, payload_json, payload_zlib)
+    
+    @staticmethod
+    def decode_payload(row: Any) -> Dict[str, Any]:
+        """Parse an events row's payload, compressed (payload_zlib) or not"""
+        blob = row["payload_zlib"]
+        if blob is not None:
+            return json.loads(zlib.decompress(blob))
+        return json.loads(row["payload_json"])
     
     def upsert_step(self, step_data: Dict[str, Any]):
         """Insert or update step aggregation (v0.1.3)"""
-        cursor = self.conn.cursor()
+        self.upsert_steps([step_data])
+    
+    @_locked_write
+    def upsert_steps(self, steps: List[Dict[str, Any]]):
+        """
+        Insert or update many step aggregations (caller commits).
         
+        Existing rows (same run_id, step_id, attempt) get the given columns
+        updated; other columns are left as they are. Steps with the same
+        column set share one prepared statement and one executemany().
+        """
+        if not _HAS_UPSERT:
+            for step_data in steps:
+                self._update_or_insert_step(step_data)
+            return
+        
+        conn = self.conn
+        batch: List[list] = []
+        batch_columns: Optional[Tuple[str, ...]] = None
+        for step_data in steps:
+            # Serialize payload_json if present and not a string
+            if "payload_json" in step_data and not isinstance(step_data["payload_json"], str):
+                step_data["payload_json"] = json.dumps(step_data["payload_json"])
+            
+            columns = tuple(step_data)
+            if not _STEP_REQUIRED_COLUMNS.issubset(columns):
+                if batch:
+                    conn.executemany(_upsert_step_sql(batch_columns), batch)
+                    batch = []
+                batch_columns = None
+                self._update_or_insert_step(step_data)
+                continue
+            if columns != batch_columns:
+                if batch:
+                    conn.executemany(_upsert_step_sql(batch_columns), batch)
+                batch = []
+                batch_columns = columns
+            batch.append([step_data[k] for k in columns])
+        if batch:
+            conn.executemany(_upsert_step_sql(batch_columns), batch)
+    
+    def _update_or_insert_step(self, step_data: Dict[str, Any]):
+        """upsert_step as UPDATE, then INSERT if no row matched (SQLite < 3.24, partial updates)"""
         # Serialize payload_json if present and not a string
         if "payload_json" in step_data and not isinstance(step_data["payload_json"], str):
             step_data["payload_json"] = json.dumps(step_data["payload_json"])
         
-        # Check if step exists
-        cursor.execute("""
-            SELECT 1 FROM steps
-            WHERE run_id = ? AND step_id = ? AND attempt = ?
-        """, (step_data["run_id"], step_data["step_id"], step_data.get("attempt", 1)))
-        
-        exists = cursor.fetchone() is not None
-        
-        if exists:
-            # Update existing
-            set_parts = []
-            values = []
-            for key, value in step_data.items():
-                if key not in ("run_id", "step_id", "attempt"):
-                    set_parts.append(f"{key} = ?")
-                    values.append(value)
-            
+        columns = tuple(step_data)
+        updates = tuple(c for c in columns if c not in _STEP_KEY_COLUMNS)
+        if updates:
+            values = [step_data[c] for c in updates]
             values.extend([step_data["run_id"], step_data["step_id"], step_data.get("attempt", 1)])
-            
-            cursor.execute(f"""
-                UPDATE steps
-                SET {", ".join(set_parts)}
-                WHERE run_id = ? AND step_id = ? AND attempt = ?
-            """, values)
-        else:
-            # Insert new
-            keys = list(step_data.keys())
-            placeholders = ", ".join(["?"] * len(keys))
-            cursor.execute(f"""
-                INSERT INTO steps ({", ".join(keys)})
-                VALUES ({placeholders})
-            """, [step_data[k] for k in keys])
+            if self.conn.execute(_update_step_sql(updates), values).rowcount:
+                return
+        
+        self.conn.execute(_insert_step_sql(columns), [step_data[c] for c in columns])
     
     def query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
         """Execute SQL query"""
-        cursor = self.conn.cursor()
-        cursor.execute(sql, params)
+        columns, rows = self.query_rows(sql, params)
+        return list(map(_row_dict_ctor(tuple(columns)), rows))
+    
+    def query_rows(self, sql: str, params: tuple = ()) -> Tuple[List[str], List[tuple]]:
+        """Execute SQL query; (column names, plain row tuples)"""
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(sql, params)
+            columns = [d[0] for d in cursor.description] if cursor.description else []
+            return columns, cursor.fetchall()
+    
+    def query_json(self, sql: str, params: tuple = ()) -> str:
+        """
+        Execute SQL query; result rows as a JSON array of objects, built by SQLite
         
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        Same shape as json.dumps(self.query(sql, params)) without the
+        Python round-trip. Result columns must not be BLOBs.
+        """
+        with self._reader() as conn:
+            cursor = conn.execute(f"SELECT * FROM ({sql}) LIMIT 0", params)
+            fields = ", ".join(
+                "'{}', \"{}\"".format(d[0].replace("'", "''"), d[0].replace('"', '""'))
+                for d in cursor.description
+            )
+            row = conn.execute(f"SELECT json_group_array(json_object({fields})) FROM ({sql})", params).fetchone()
+        return row[0]
+    
+    def events_jsonl(self, run_id: str) -> str:
+        """A run's event payloads as JSON lines, in seq order"""
+        with self._reader() as conn:
+            compressed = conn.execute(
+                "SELECT 1 FROM events WHERE run_id = ? AND payload_zlib IS NOT NULL LIMIT 1", (run_id,)
+            ).fetchone()
+            if compressed is None:
+                # Payloads are already JSON text: let SQLite join them
+                row = conn.execute(
+                    "SELECT group_concat(payload_json, char(10)) FROM "
+                    "(SELECT payload_json FROM events WHERE run_id = ? ORDER BY seq)",
+                    (run_id,),
+                ).fetchone()
+                return row[0] or ""
+            rows = conn.execute(
+                "SELECT payload_json, payload_zlib FROM events WHERE run_id = ? ORDER BY seq", (run_id,)
+            )
+            return "\n".join(
+                zlib.decompress(blob).decode("utf-8") if blob is not None else text
+                for text, blob in rows
+            )
     
     def get_stats(self, run_id: Optional[str] = None) -> Dict[str, Any]:
         """Get database statistics, optionally filtered by run_id"""
-        cursor = self.conn.cursor()
-        
-        where_clause = f"WHERE run_id = '{run_id}'" if run_id else ""
-        
-        # Count events
-        cursor.execute(f"SELECT COUNT(*) as count FROM events {where_clause}")
-        event_count = cursor.fetchone()["count"]
-        
-        # Count steps
-        cursor.execute(f"SELECT COUNT(*) as count FROM steps {where_clause}")
-        step_count = cursor.fetchone()["count"]
-        
-        # Count runs
-        if run_id:
-            run_count = 1
-        else:
-            cursor.execute("SELECT COUNT(*) as count FROM runs")
-            run_count = cursor.fetchone()["count"]
-        
-        # Status distribution
-        cursor.execute(f"""
-            SELECT status, COUNT(*) as count 
-            FROM steps 
-            WHERE status IS NOT NULL {f"AND run_id = '{run_id}'" if run_id else ""}
-            GROUP BY status
-            ORDER BY count DESC
-        """)
-        status_dist = {row["status"]: row["count"] for row in cursor.fetchall()}
-        
-        # Kind distribution (v0.1.3)
-        cursor.execute(f"""
-            SELECT kind, COUNT(*) as count
-            FROM steps
-            {where_clause}
-            GROUP BY kind
-            ORDER BY count DESC
-            LIMIT 10
-        """)
-        kind_dist = {row["kind"]: row["count"] for row in cursor.fetchall()}
+        # Bound parameter (not inlined) so each query's text is constant
+        # and its prepared statement is reused
+        where_clause = "WHERE run_id = ?" if run_id else ""
+        params = (run_id,) if run_id else ()
         
-        # Name distribution (top 10 step names)
-        cursor.execute(f"""
-            SELECT name, COUNT(*) as count
-            FROM steps
-            {where_clause}
-            GROUP BY name
-            ORDER BY count DESC
-            LIMIT 10
-        """)
-        name_dist = {row["name"]: row["count"] for row in cursor.fetchall()}
+        with self._reader() as conn:
+            # Count events
+            event_count = conn.execute(f"SELECT COUNT(*) as count FROM events {where_clause}", params).fetchone()["count"]
+            
+            # Count steps
+            step_count = conn.execute(f"SELECT COUNT(*) as count FROM steps {where_clause}", params).fetchone()["count"]
+            
+            # Count runs
+            if run_id:
+                run_count = 1
+            else:
+                run_count = conn.execute("SELECT COUNT(*) as count FROM runs").fetchone()["count"]
+            
+            # Status distribution
+            rows = conn.execute(f"""
+                SELECT status, COUNT(*) as count 
+                FROM steps 
+                WHERE status IS NOT NULL {"AND run_id = ?" if run_id else ""}
+                GROUP BY status
+                ORDER BY count DESC
+            """, params)
+            status_dist = {row["status"]: row["count"] for row in rows}
+            
+            # Kind distribution (v0.1.3)
+            rows = conn.execute(f"""
+                SELECT kind, COUNT(*) as count
+                FROM steps
+                {where_clause}
+                GROUP BY kind
+                ORDER BY count DESC
+                LIMIT 10
+            """, params)
+            kind_dist = {row["kind"]: row["count"] for row in rows}
+            
+            # Name distribution (top 10 step names)
+            rows = conn.execute(f"""
+                SELECT name, COUNT(*) as count
+                FROM steps
+                {where_clause}
+                GROUP BY name
+                ORDER BY count DESC
+                LIMIT 10
+            """, params)
+            name_dist = {row["name"]: row["count"] for row in rows}
         
         return {
             "events": event_count,
@@ -337,6 +691,11 @@ class SQLiteStore:
             "name_distribution": name_dist,
         }
     
+    def optimize(self):
+        """Refresh query planner statistics where stale (PRAGMA optimize)"""
+        self.conn.execute("PRAGMA optimize")
+    
+    @_locked_write
     def commit(self):
         """Commit transaction"""
         if self.conn:
@@ -4,6 +4,11 @@ import json
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Literal
 
+try:
+    import orjson  # optional fast path: pip install failcore[fast]
+except ImportError:
+    orjson = None
+
 
 class McpCodecError(RuntimeError):
     pass
@@ -61,20 +66,63 @@ class JsonRpcCodec:
         """
         Encode a JSON-RPC message into framed bytes.
         """
-        payload = json.dumps(msg, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return b"".join(self.encode_parts(msg))
+
+    def encode_parts(self, msg: Dict[str, Any]) -> List[bytes]:
+        """
+        Encode a JSON-RPC message into framing + payload buffers, for
+        writelines() without joining them first.
+        """
+        payload = None
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(msg)
+            except TypeError:
+                pass  # e.g. non-str keys, ints beyond 64 bits: let json decide
+        if payload is None:
+            payload = json.dumps(msg, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
         if len(payload) > self._cfg.max_message_bytes:
             raise McpCodecError(f"message too large to encode: {len(payload)} bytes")
 
         if self._cfg.mode == "ndjson":
-            return payload + b"\n"
+            return [payload, b"\n"]
 
         if self._cfg.mode == "content_length":
             header = f"Content-Length: {len(payload)}\r\n\r\n".encode("ascii")
-            return header + payload
+            return [header, payload]
 
         raise McpCodecError(f"unknown codec mode: {self._cfg.mode}")
 
+    # =========================================================
+    # Decode (single frame)
+    # =========================================================
+
+    def decode_message(self, payload: bytes) -> Dict[str, Any]:
+        """
+        Decode one complete frame payload (no framing bytes) into a message.
+        """
+        try:
+            obj = json.loads(payload)
+        except Exception as e:
+            raise McpCodecError(f"invalid JSON payload: {e}") from e
+
+        if not isinstance(obj, dict):
+            raise McpCodecError(f"{self._cfg.mode} message must be a JSON object")
+        return obj
+
+    def parse_header(self, header: bytes) -> int:
+        """
+        Parse and bound-check a Content-Length header block (without the
+        trailing \\r\\n\\r\\n). Returns the payload length.
+        """
+        expected = self._parse_content_length(header)
+        if expected <= 0:
+            raise McpCodecError(f"invalid Content-Length: {expected}")
+        if expected > self._cfg.max_message_bytes:
+            raise McpCodecError(f"Content-Length too large: {expected} > {self._cfg.max_message_bytes}")
+        return expected
+
     # =========================================================
     # Decode (incremental)
     # =========================================================
@@ -153,13 +201,7 @@ class JsonRpcCodec:
                 header_bytes = bytes(self._buf[:header_end])
                 del self._buf[: header_end + 4]  # remove header + \r\n\r\n
 
-                expected = self._parse_content_length(header_bytes)
-                if expected <= 0:
-                    raise McpCodecError(f"invalid Content-Length: {expected}")
-                if expected > self._cfg.max_message_bytes:
-                    raise McpCodecError(f"Content-Length too large: {expected} > {self._cfg.max_message_bytes}")
-
-                self._expected_len = expected
+                self._expected_len = self.parse_header(header_bytes)
 
             # Step 2: read payload of _expected_len
             assert self._expected_len is not None
@@ -170,14 +212,7 @@ class JsonRpcCodec:
             del self._buf[: self._expected_len]
             self._expected_len = None
 
-            try:
-                obj = json.loads(payload.decode("utf-8"))
-            except Exception as e:
-                raise McpCodecError(f"invalid JSON payload: {e}") from e
-
-            if not isinstance(obj, dict):
-                raise McpCodecError("content_length message must be a JSON object")
-            out.append(obj)
+            out.append(self.decode_message(payload))
 
         return out
 
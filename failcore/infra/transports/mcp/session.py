@@ -11,6 +11,13 @@ from typing import Any, Awaitable, Callable, Dict, Optional
 from .codec import JsonRpcCodec, JsonRpcCodecConfig, McpCodecError
 from .egress import McpEgressIntegration
 
+try:
+    import fcntl
+    _F_SETPIPE_SZ: Optional[int] = getattr(fcntl, "F_SETPIPE_SZ", None)  # Linux only
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    _F_SETPIPE_SZ = None
+
 
 class McpSessionError(RuntimeError):
     pass
@@ -28,6 +35,10 @@ class McpTimeout(McpSessionError):
     pass
 
 
+# Marks a message without an "id" key in _handle_msg
+_NO_ID = object()
+
+
 NotificationHandler = Callable[[dict[str, Any]], Awaitable[None]]
 
 
@@ -57,6 +68,10 @@ class McpSessionConfig:
         Base backoff for restarts (exponential-ish).
     serialize_requests:
         If True, serialize requests at session level (recommended for stdio).
+    pipe_buffer_bytes:
+        Kernel buffer size requested for the stdin/stdout pipes (Linux,
+        best effort; 0 keeps the 64KB default), so large frames need fewer
+        wakeups per message.
     """
 
     command: list[str]
@@ -74,6 +89,8 @@ class McpSessionConfig:
 
     serialize_requests: bool = True
 
+    pipe_buffer_bytes: int = 1 << 20
+
 
 class McpSession:
     """
@@ -81,7 +98,7 @@ class McpSession:
 
     Improvements over Phase 0.7 draft:
       - Framing via JsonRpcCodec (ndjson or content-length)
-      - Chunk-based reader loop (supports any framing)
+      - Frame-at-a-time reader loop (ndjson / content-length)
       - Optional notification handler for server->client messages
     """
 
@@ -110,7 +127,6 @@ class McpSession:
 
         # Used to signal crash to callers
         self._crash_event = asyncio.Event()
-        self._crash_waiter_task: Optional[asyncio.Task[bool]] = None
 
     # =========================================================
     # Lifecycle
@@ -226,7 +242,11 @@ class McpSession:
 
             t = timeout_s if timeout_s is not None else self._cfg.request_timeout_s
             try:
-                result = await asyncio.wait_for(self._wait_future_or_crash(fut), timeout=t)
+                # A crash after this point fails fut via _fail_all_pending
+                # (reader loop exit / restart); only an earlier one needs a check
+                if self._crash_event.is_set() and not fut.done():
+                    raise McpProcessCrashed("MCP process crashed during request")
+                result = await asyncio.wait_for(fut, timeout=t)
                 # Observability: MCP_TX (success)
                 print(f"[MCP_TX] id={req_id} ok=True", file=sys.stderr)
                 
@@ -262,24 +282,6 @@ class McpSession:
             
             raise
 
-    async def _wait_future_or_crash(self, fut: asyncio.Future[Any]) -> Any:
-        """
-        Wait for the response future, but if the process crashes first, raise.
-        Avoids per-call task leaks by reusing a crash waiter task.
-        """
-        crash_task = self._get_crash_waiter_task()
-        done, _ = await asyncio.wait([fut, crash_task], return_when=asyncio.FIRST_COMPLETED)
-
-        if fut in done:
-            return fut.result()
-
-        raise McpProcessCrashed("MCP process crashed during request")
-
-    def _get_crash_waiter_task(self) -> asyncio.Task[bool]:
-        if self._crash_waiter_task is None or self._crash_waiter_task.done():
-            self._crash_waiter_task = asyncio.create_task(self._crash_event.wait())
-        return self._crash_waiter_task
-
     # =========================================================
     # Process management
     # =========================================================
@@ -298,10 +300,20 @@ class McpSession:
             stderr=asyncio.subprocess.PIPE,
             cwd=self._cfg.cwd,
             env=env,
+            # StreamReader line/separator limit: one whole frame must fit
+            limit=self._cfg.max_message_bytes + 1,
         )
 
         self._crash_event.clear()
 
+        if self._cfg.pipe_buffer_bytes > 0:
+            assert self._proc.stdin is not None
+            _grow_pipe(self._proc.stdin.transport, self._cfg.pipe_buffer_bytes)
+            # No public accessor for the stdout pipe transport
+            subprocess_transport = getattr(self._proc, "_transport", None)
+            if subprocess_transport is not None:
+                _grow_pipe(subprocess_transport.get_pipe_transport(1), self._cfg.pipe_buffer_bytes)
+
         # Reset codec buffer/state on restart
         self._codec = JsonRpcCodec(
             JsonRpcCodecConfig(mode=self._cfg.codec_mode, max_message_bytes=self._cfg.max_message_bytes)
@@ -395,13 +407,14 @@ class McpSession:
         assert self._proc.stdin is not None
 
         try:
-            data = self._codec.encode(msg)
+            parts = self._codec.encode_parts(msg)
         except Exception as e:
             raise McpSessionError(f"failed to encode json-rpc message: {e}") from e
 
         async with self._write_lock:
             try:
-                self._proc.stdin.write(data)
+                # Framing and payload as separate buffers (no join here)
+                self._proc.stdin.writelines(parts)
                 await self._proc.stdin.drain()
             except (BrokenPipeError, ConnectionResetError):
                 self._crash_event.set()
@@ -411,28 +424,49 @@ class McpSession:
 
     async def _reader_loop(self) -> None:
         """
-        Chunk-based reader loop:
-          - read stdout in chunks
-          - decode messages via codec.feed()
+        Frame reader loop:
+          - read one frame per await (readuntil / readexactly on stdout)
+          - decode it via the codec
           - route responses (id present) to pending futures
           - route notifications (no id) to on_notification
+        Unknown codec modes fall back to chunked reads + codec.feed().
         """
         assert self._proc is not None
         assert self._proc.stdout is not None
 
+        if self._cfg.codec_mode == "ndjson":
+            read_frame = self._read_ndjson_frame
+        elif self._cfg.codec_mode == "content_length":
+            read_frame = self._read_content_length_frame
+        else:
+            read_frame = None
+
         try:
             while True:
-                chunk = await self._proc.stdout.read(4096)
-                if not chunk:
-                    break
+                if read_frame is None:
+                    chunk = await self._proc.stdout.read(4096)
+                    if not chunk:
+                        break
+
+                    try:
+                        msgs = self._codec.feed(chunk)
+                    except McpCodecError as e:
+                        # Protocol framing error -> treat as crash-ish
+                        raise McpSessionError(f"codec decode error: {e}") from e
+
+                    for msg in msgs:
+                        await self._handle_msg(msg)
+                    continue
 
                 try:
-                    msgs = self._codec.feed(chunk)
-                except McpCodecError as e:
+                    msg = await read_frame(self._proc.stdout)
+                except asyncio.IncompleteReadError:
+                    break  # EOF (a trailing partial frame is dropped, as with feed())
+                except (McpCodecError, asyncio.LimitOverrunError) as e:
                     # Protocol framing error -> treat as crash-ish
                     raise McpSessionError(f"codec decode error: {e}") from e
 
-                for msg in msgs:
+                if msg is not None:
                     await self._handle_msg(msg)
 
         except asyncio.CancelledError:
@@ -444,10 +478,23 @@ class McpSession:
             self._crash_event.set()
             self._fail_all_pending(McpProcessCrashed("MCP reader loop terminated"))
 
+    async def _read_ndjson_frame(self, stdout: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+        """Read one ndjson line; None for a blank line."""
+        line = (await stdout.readuntil(b"\n")).strip()
+        if not line:
+            return None
+        return self._codec.decode_message(line)
+
+    async def _read_content_length_frame(self, stdout: asyncio.StreamReader) -> Dict[str, Any]:
+        """Read one Content-Length framed message."""
+        header = await stdout.readuntil(b"\r\n\r\n")
+        length = self._codec.parse_header(header[:-4])
+        return self._codec.decode_message(await stdout.readexactly(length))
+
     async def _handle_msg(self, msg: Dict[str, Any]) -> None:
-        # Response has "id"
-        if "id" in msg:
-            req_id = msg.get("id")
+        # Response has "id" (one probe; a null id is still a response)
+        req_id = msg.get("id", _NO_ID)
+        if req_id is not _NO_ID:
             fut = self._pending.pop(req_id, None)
             if fut is None:
                 return
@@ -477,3 +524,15 @@ class McpSession:
         rid = self._next_id
         self._next_id += 1
         return rid
+
+
+def _grow_pipe(pipe_transport: Any, size: int) -> None:
+    """Best effort: enlarge a subprocess pipe's kernel buffer (F_SETPIPE_SZ)."""
+    if _F_SETPIPE_SZ is None or pipe_transport is None:
+        return
+    pipe = pipe_transport.get_extra_info("pipe")
+    try:
+        fcntl.fcntl(pipe.fileno(), _F_SETPIPE_SZ, size)
+    except (OSError, ValueError, AttributeError):
+        # Over /proc/sys/fs/pipe-max-size, user pipe quota, closed pipe...
+        pass
@@ -12,6 +12,14 @@ from failcore.core.runtime.types import CallContext, Receipt, ToolEvent, ToolRes
 from .session import McpSession, McpSessionConfig, McpSessionError
 
 
+# Accepted receipt kinds / event types; anything else is coerced to the default
+_ALLOWED_RECEIPT_KINDS = frozenset(("file", "network", "process", "resource", "custom"))
+_ALLOWED_EVENT_TYPES = frozenset(("progress", "log", "partial"))
+
+# Sentinel for "key absent" in single-lookup dict.get calls
+_MISSING = object()
+
+
 @dataclass
 class McpTransportConfig:
     """
@@ -96,8 +104,22 @@ class McpTransport(BaseTransport):
     def __init__(self, cfg: McpTransportConfig) -> None:
         self._cfg = cfg
 
+        # Notification method -> event type (None: generic envelope, type
+        # hinted in params). Filled in reverse so that, as with an if/elif
+        # chain, the earlier method wins if two are configured the same.
+        self._method_types: Dict[str, Optional[str]] = {}
+        for method, etype in (
+            (cfg.generic_event_method, None),
+            (cfg.partial_method, "partial"),
+            (cfg.log_method, "log"),
+            (cfg.progress_method, "progress"),
+        ):
+            self._method_types[method] = etype
+
+        # Emitter of the in-flight tool call, read by _on_notification.
+        # Only touched from the event loop, with no await between read and
+        # use, so plain attribute access needs no lock.
         self._active_emit: Optional[EventEmitter] = None
-        self._emit_lock = asyncio.Lock()
 
         self._session = McpSession(cfg.session, on_notification=self._on_notification)
 
@@ -239,8 +261,7 @@ class McpTransport(BaseTransport):
 
         print(f"[MCP_TOOL_CALL] tool={tool.name} args_keys={list((args or {}).keys())} run_id={ctx.run_id}", file=sys.stderr)
 
-        async with self._emit_lock:
-            self._active_emit = emit
+        self._active_emit = emit
 
         try:
             emit(ToolEvent(seq=0, type="progress", message="mcp rpc send", data={"tool": tool.name}))
@@ -281,15 +302,13 @@ class McpTransport(BaseTransport):
             )
 
         finally:
-            async with self._emit_lock:
-                self._active_emit = None
+            self._active_emit = None
 
     async def _on_notification(self, msg: dict[str, Any]) -> None:
         method = msg.get("method")
         params = msg.get("params") if isinstance(msg.get("params"), dict) else {}
 
-        async with self._emit_lock:
-            emit = self._active_emit
+        emit = self._active_emit
 
         if emit is None:
             return
@@ -301,16 +320,10 @@ class McpTransport(BaseTransport):
             message = params.get("message") or params.get("text")
             data = params.get("data") if "data" in params else params
 
-        etype = "log"
-        if method == self._cfg.progress_method:
-            etype = "progress"
-        elif method == self._cfg.log_method:
-            etype = "log"
-        elif method == self._cfg.partial_method:
-            etype = "partial"
-        elif method == self._cfg.generic_event_method:
+        etype = self._method_types.get(method, "log") if isinstance(method, str) else "log"
+        if etype is None:
             hinted = params.get("type") if isinstance(params, dict) else None
-            if hinted in ("progress", "log", "partial"):
+            if isinstance(hinted, str) and hinted in _ALLOWED_EVENT_TYPES:
                 etype = hinted
             else:
                 etype = "log"
@@ -331,17 +344,27 @@ class McpTransport(BaseTransport):
 
 def _extract_tools_list(res: Any) -> List[Dict[str, Any]]:
     if isinstance(res, dict):
-        if "tools" in res and isinstance(res["tools"], list):
-            return [t for t in res["tools"] if isinstance(t, dict)]
-        if "result" in res and isinstance(res["result"], dict):
-            r = res["result"]
-            if "tools" in r and isinstance(r["tools"], list):
-                return [t for t in r["tools"] if isinstance(t, dict)]
+        tools = res.get("tools")
+        if isinstance(tools, list):
+            return _only_dicts(tools)
+        r = res.get("result")
+        if isinstance(r, dict):
+            tools = r.get("tools")
+            if isinstance(tools, list):
+                return _only_dicts(tools)
     if isinstance(res, list):
-        return [t for t in res if isinstance(t, dict)]
+        return _only_dicts(res)
     return []
 
 
+def _only_dicts(items: List[Any]) -> List[Dict[str, Any]]:
+    # Well-formed listings are all dicts: hand back the list itself, no copy
+    for t in items:
+        if type(t) is not dict:
+            return [t for t in items if isinstance(t, dict)]
+    return items
+
+
 def _normalize_call_result(raw: Any) -> tuple[bool, Optional[Any], Optional[Dict[str, Any]]]:
     """
     Normalize MCP call result into ToolResult format
@@ -362,16 +385,17 @@ def _normalize_call_result(raw: Any) -> tuple[bool, Optional[Any], Optional[Dict
             err = raw.get("error") or {"message": "tool returned error"}
             return False, None, _extract_structured_error(err, "ToolError")
 
-        if "error" in raw and raw["error"] is not None and "content" not in raw:
-            err = raw["error"]
-            return False, None, _extract_structured_error(err, "ToolError")
+        # Success path (content wins over a stray "error" key)
+        content = raw.get("content", _MISSING)
+        if content is not _MISSING:
+            return True, content, None
 
-        # Success paths
-        if "content" in raw:
-            return True, raw.get("content"), None
+        err = raw.get("error")
+        if err is not None:
+            return False, None, _extract_structured_error(err, "ToolError")
 
-        if "result" in raw:
-            r = raw.get("result")
+        r = raw.get("result", _MISSING)
+        if r is not _MISSING:
             if isinstance(r, dict) and "content" in r:
                 return True, r.get("content"), None
             return True, r, None
@@ -548,9 +572,15 @@ def _extract_receipts(raw: Any) -> List[Receipt]:
         for item in lst:
             if not isinstance(item, dict):
                 continue
-            kind = item.get("kind") or item.get("type") or "custom"
-            data = item.get("data") if isinstance(item.get("data"), dict) else {"value": item.get("data", item)}
-            if kind not in ("file", "network", "process", "resource", "custom"):
+            g = item.get
+            kind = g("kind") or g("type") or "custom"
+            data = g("data", _MISSING)
+            if data is _MISSING:
+                data = {"value": item}
+            elif not isinstance(data, dict):
+                data = {"value": data}
+            # isinstance first: frozenset membership needs a hashable value
+            if not isinstance(kind, str) or kind not in _ALLOWED_RECEIPT_KINDS:
                 kind = "custom"
             receipts.append(Receipt(kind=kind, data=data))
 
@@ -570,15 +600,16 @@ def _emit_bundled_events(emit: EventEmitter, raw: Any) -> None:
         for e in lst:
             if not isinstance(e, dict):
                 continue
-            et = e.get("type") or e.get("kind") or "log"
-            if et not in ("progress", "log", "partial"):
+            g = e.get
+            et = g("type") or g("kind") or "log"
+            if not isinstance(et, str) or et not in _ALLOWED_EVENT_TYPES:
                 et = "log"
             emit(
                 ToolEvent(
                     seq=0,
                     type=et,
-                    message=e.get("message"),
-                    data=e.get("data"),
+                    message=g("message"),
+                    data=g("data"),
                 )
             )
 
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 import hashlib
@@ -40,8 +41,11 @@ PROJECT_ROOT_MARKERS = [
     "setup.cfg",          # Python project (legacy)
 ]
 
-# Global cache for project root (resolved once per process)
-_PROJECT_ROOT_CACHE: Optional[Path] = None
+_MARKER_SET = frozenset(PROJECT_ROOT_MARKERS)
+_ANCHOR_MARKER = PROJECT_ROOT_MARKERS[0]
+
+# Per-directory marker scan results: directory -> root found from it (or None)
+_MARKER_SCAN_CACHE: dict[str, Optional[Path]] = {}
 
 # Optional: enable debug prints (kept minimal; does not create files)
 _DEBUG = os.getenv("FAILCORE_DEBUG_PATHS", "").strip().lower() in {"1", "true", "yes"}
@@ -52,13 +56,22 @@ def _debug(msg: str) -> None:
         print(f"[failcore.paths] {msg}", file=sys.stderr)
 
 
-def _is_relative_to(path: Path, base: Path) -> bool:
-    """Python<3.9 compatibility for Path.is_relative_to()."""
-    try:
-        path.resolve().relative_to(base.resolve())
-        return True
-    except Exception:
-        return False
+def _is_relative_to(path: Path | str, base: Path | str) -> bool:
+    """
+    Python<3.9 compatibility for Path.is_relative_to().
+
+    Absolute inputs are compared as normalized strings without touching the
+    filesystem; anything else is resolved first.
+    """
+    path_str = os.path.normpath(str(path))
+    base_str = os.path.normpath(str(base))
+    if not (os.path.isabs(path_str) and os.path.isabs(base_str)):
+        try:
+            path_str = str(Path(path_str).resolve())
+            base_str = str(Path(base_str).resolve())
+        except Exception:
+            return False
+    return path_str == base_str or path_str.startswith(base_str.rstrip(os.sep) + os.sep)
 
 
 def _entry_script_dir() -> Optional[Path]:
@@ -106,19 +119,60 @@ def _find_root_from_path(start_path: Path) -> Optional[Path]:
     if current.is_file():
         current = current.parent
 
+    visited: list[str] = []
+    root: Optional[Path] = None
     while True:
-        for marker in PROJECT_ROOT_MARKERS:
-            if (current / marker).exists():
-                _debug(f"root marker hit: {(current / marker)}")
-                return current
+        key = str(current)
+        if key in _MARKER_SCAN_CACHE:
+            root = _MARKER_SCAN_CACHE[key]
+            break
+        visited.append(key)
+
+        if _has_marker(current):
+            root = current
+            break
 
         # Reached filesystem root: still need to check that root (done above),
         # then terminate.
         if current.parent == current:
-            return None
+            break
 
         current = current.parent
 
+    for key in visited:
+        _MARKER_SCAN_CACHE[key] = root
+    return root
+
+
+def _has_marker(directory: Path) -> bool:
+    """
+    Check a directory for any project marker with a single listing.
+    """
+    base = str(directory)
+
+    # Explicit anchor wins without listing the directory
+    anchor = os.path.join(base, _ANCHOR_MARKER)
+    if os.path.exists(anchor):
+        _debug(f"root marker hit: {anchor}")
+        return True
+
+    try:
+        with os.scandir(base) as it:
+            names = _MARKER_SET.intersection(entry.name for entry in it)
+    except OSError:
+        # Unlistable (e.g. execute-only) directory: probe markers directly
+        names = _MARKER_SET
+
+    for marker in PROJECT_ROOT_MARKERS:
+        if marker not in names or marker == _ANCHOR_MARKER:
+            continue
+        # exists() follows symlinks, so dangling marker links don't count
+        hit = os.path.join(base, marker)
+        if os.path.exists(hit):
+            _debug(f"root marker hit: {hit}")
+            return True
+    return False
+
 
 def _home_fallback_root(seed: str) -> Path:
     """
@@ -139,46 +193,55 @@ def find_project_root() -> Path:
     2. From entry script directory, traverse upward looking for markers
     3. Fallback to ~/.failcore/projects/<hash> (NOT CWD)
 
+    The result is memoized per (CWD, FAILCORE_PROJECT_ROOT), so a later
+    os.chdir() is picked up instead of returning a stale root.
+
     Returns:
         Path to project root directory (NOT including ".failcore")
     """
-    global _PROJECT_ROOT_CACHE
+    return _cached_root(os.getcwd(), os.getenv("FAILCORE_PROJECT_ROOT", "").strip())[0]
 
-    if _PROJECT_ROOT_CACHE is not None:
-        return _PROJECT_ROOT_CACHE
 
+def _resolved_project_root() -> str:
+    """
+    str(find_project_root().resolve()), memoized with the root itself.
+    """
+    return _cached_root(os.getcwd(), os.getenv("FAILCORE_PROJECT_ROOT", "").strip())[1]
+
+
+@lru_cache(maxsize=32)
+def _cached_root(cwd: str, env_root: str) -> Tuple[Path, str]:
+    """
+    Resolve the project root for a given CWD and override value.
+    Returns (root, str(root.resolve())).
+    """
     # 0) Explicit override (useful for CI / sandbox / embedding into other tools)
-    env_root = os.getenv("FAILCORE_PROJECT_ROOT", "").strip()
     if env_root:
         p = Path(env_root).expanduser().resolve()
-        _PROJECT_ROOT_CACHE = p
         _debug(f"project root override: {p}")
-        return p
+        return p, str(p)
 
     # 1) CWD upward scan
-    cwd = Path.cwd()
-    root = _find_root_from_path(cwd)
+    cwd_path = Path(cwd)
+    root = _find_root_from_path(cwd_path)
     if root is not None:
-        _PROJECT_ROOT_CACHE = root
         _debug(f"project root from CWD: {root}")
-        return root
+        return root, str(root)
 
     # 2) entry script dir upward scan
     entry_dir = _entry_script_dir()
     if entry_dir is not None:
         root = _find_root_from_path(entry_dir)
         if root is not None:
-            _PROJECT_ROOT_CACHE = root
             _debug(f"project root from entry script: {root}")
-            return root
+            return root, str(root)
 
     # 3) Fallback: user home, but isolated by seed to avoid mixing
     # Prefer entry_dir seed, else cwd.
-    seed_path = str(entry_dir.resolve()) if entry_dir is not None else str(cwd.resolve())
+    seed_path = str(entry_dir.resolve()) if entry_dir is not None else str(cwd_path.resolve())
     fallback = _home_fallback_root(seed_path)
-    _PROJECT_ROOT_CACHE = fallback
     _debug(f"project root fallback: {fallback} (seed={seed_path})")
-    return fallback
+    return fallback, str(fallback.resolve())
 
 
 def get_failcore_root() -> Path:
@@ -200,14 +263,20 @@ def format_relative_path(path: Path) -> str:
     Prefers project-relative paths; falls back to trimming from ".failcore" if present.
     """
     try:
-        project_root = find_project_root()
+        root_str = _resolved_project_root()
         p = path
         if not isinstance(p, Path):
             p = Path(str(p))
 
-        if p.is_absolute() and _is_relative_to(p, project_root):
-            rel_path = p.resolve().relative_to(project_root.resolve())
-            return str(rel_path).replace("\\", "/")
+        if p.is_absolute():
+            # Fast path: plain string prefix against the cached resolved root
+            path_str = os.path.normpath(str(p))
+            if _is_relative_to(path_str, root_str):
+                return os.path.relpath(path_str, root_str).replace("\\", "/")
+            # Slow path: the path may only reach the root through symlinks
+            resolved = str(p.resolve())
+            if _is_relative_to(resolved, root_str):
+                return os.path.relpath(resolved, root_str).replace("\\", "/")
 
         parts = p.parts
         if ".failcore" in parts:
@@ -395,8 +464,8 @@ def reset_project_root_cache() -> None:
     """
     Reset cached project root (useful for testing).
     """
-    global _PROJECT_ROOT_CACHE
-    _PROJECT_ROOT_CACHE = None
+    _cached_root.cache_clear()
+    _MARKER_SCAN_CACHE.clear()
 
 
 def resolve_and_verify(
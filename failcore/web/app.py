@@ -51,6 +51,10 @@ def create_app() -> FastAPI:
     app.include_router(drift_api.router)
     app.include_router(policy_api.router)
     
+    # Build the shared validator registry now rather than on the first policy request
+    from failcore.core.validate.bootstrap import auto_register
+    auto_register()
+    
     return app
 
 
@@ -3,11 +3,18 @@
 Policy management API endpoints
 """
 
+from functools import lru_cache
 from pathlib import Path
 from fastapi import APIRouter, HTTPException, Request
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+import json
 import traceback
 
+try:
+    import orjson  # optional fast path: pip install failcore[fast]
+except ImportError:
+    orjson = None
+
 from failcore.core.validate.registry import ValidatorRegistry
 from failcore.core.validate.bootstrap import create_default_registry, auto_register
 from failcore.core.validate.loader import (
@@ -25,6 +32,73 @@ from failcore.core.validate.contracts.v1.context import ContextV1
 
 router = APIRouter(prefix="/api/policy", tags=["policy"])
 
+# Shared engine for /explain (created on first use)
+_explain_engine: Optional[ValidationEngine] = None
+
+
+async def _json_body(request: Request) -> Dict[str, Any]:
+    """
+    Parse a JSON object request body (orjson when available).
+    An empty body yields {} so handlers report "No data provided".
+    """
+    raw = await request.body()
+    if not raw.strip():
+        return {}
+    try:
+        if orjson is not None:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # stdlib accepts a few things orjson rejects (NaN, Infinity)
+                data = json.loads(raw)
+        else:
+            data = json.loads(raw)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail={'error': f'Invalid JSON body: {e}'})
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail={'error': 'JSON body must be an object'})
+    return data
+
+
+@lru_cache(maxsize=64)
+def _cached_dump(path_str: str, mtime_ns: int, size: int, fmt: str) -> tuple[str, Dict[str, Any]]:
+    """
+    Serialized content and model_dump() of a policy file.
+    Keyed on the file's mtime/size so edits on disk invalidate the entry;
+    callers must not mutate the returned dict.
+    """
+    policy = load_policy(Path(path_str))
+    return dump_policy(policy, format=fmt), policy.model_dump()
+
+
+@lru_cache(maxsize=8)
+def _merged_for(active_path: str, mtime_ns: int, size: int) -> Policy:
+    """
+    load_merged_policy() keyed on active.yaml's path and mtime/size.
+    With default arguments the merge reads only active.yaml, so this key
+    covers every input; callers must not mutate the returned policy.
+    """
+    return load_merged_policy()
+
+
+def _load_merged_policy_cached() -> Policy:
+    """Merged policy, reparsed only when active.yaml changes on disk"""
+    active_file = get_policy_dir() / "active.yaml"
+    try:
+        st = active_file.stat()
+    except OSError:
+        # Missing: let load_merged_policy() auto-initialize (not cached)
+        return load_merged_policy()
+    return _merged_for(str(active_file), st.st_mtime_ns, st.st_size)
+
+
+def _get_explain_engine() -> ValidationEngine:
+    """Return the shared explain engine, bound to the process-wide registry"""
+    global _explain_engine
+    if _explain_engine is None:
+        _explain_engine = ValidationEngine(registry=auto_register())
+    return _explain_engine
+
 
 @router.get("/validators")
 async def list_validators() -> Dict[str, Any]:
@@ -73,13 +147,20 @@ async def init_policy() -> Dict[str, Any]:
 
 
 @router.get("/show/{policy_type}")
-async def show_policy(policy_type: str, format: str = "yaml") -> Dict[str, Any]:
-    """Show policy content"""
+async def show_policy(policy_type: str, format: str = "yaml", include_dict: bool = False) -> Dict[str, Any]:
+    """
+    Show policy content
+    
+    The parsed policy dict ('policy' key) is only included with include_dict=true.
+    """
     try:
         policy_dir = get_policy_dir()
         
         if policy_type == 'merged':
-            policy = load_merged_policy()
+            # Parsed merged policy is cached; its serialized form is not
+            policy = _load_merged_policy_cached()
+            content = dump_policy(policy, format=format)
+            policy_dict = policy.model_dump() if include_dict else None
         else:
             if policy_type not in ['active', 'shadow', 'breakglass']:
                 raise HTTPException(status_code=400, detail={'error': 'Invalid policy type'})
@@ -91,16 +172,17 @@ async def show_policy(policy_type: str, format: str = "yaml") -> Dict[str, Any]:
                     'hint': 'Run init first'
                 })
             
-            policy = load_policy(policy_file)
-        
-        content = dump_policy(policy, format=format)
+            st = policy_file.stat()
+            content, policy_dict = _cached_dump(str(policy_file), st.st_mtime_ns, st.st_size, format)
         
-        return {
+        result = {
             'policy_type': policy_type,
             'format': format,
             'content': content,
-            'policy': policy.model_dump()
         }
+        if include_dict:
+            result['policy'] = policy_dict
+        return result
         
     except HTTPException:
         raise
@@ -112,17 +194,18 @@ async def show_policy(policy_type: str, format: str = "yaml") -> Dict[str, Any]:
 
 
 @router.post("/save/{policy_type}")
-async def save_policy_file(policy_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+async def save_policy_file(policy_type: str, request: Request) -> Dict[str, Any]:
     """Save policy file"""
     try:
         if policy_type not in ['active', 'shadow', 'breakglass']:
             raise HTTPException(status_code=400, detail={'error': 'Invalid policy type'})
         
+        data = await _json_body(request)
         if not data:
             raise HTTPException(status_code=400, detail={'error': 'No data provided'})
         
         # Parse policy
-        policy = Policy(**data)
+        policy = Policy.model_validate(data)
         
         # Save to file
         policy_dir = get_policy_dir()
@@ -177,7 +260,7 @@ async def generate_shadow() -> Dict[str, Any]:
         shadow_policy_dict["metadata"]["derived_from"] = "active.yaml"
         
         # Save shadow policy
-        shadow_policy = Policy(**shadow_policy_dict)
+        shadow_policy = Policy.model_validate(shadow_policy_dict)
         save_policy(shadow_policy, shadow_file)
         
         return {
@@ -195,14 +278,15 @@ async def generate_shadow() -> Dict[str, Any]:
 
 
 @router.post("/validate-file")
-async def validate_file(data: Dict[str, Any]) -> Dict[str, Any]:
+async def validate_file(request: Request) -> Dict[str, Any]:
     """Validate a policy file"""
     try:
+        data = await _json_body(request)
         if not data:
             raise HTTPException(status_code=400, detail={'error': 'No data provided'})
         
         # Parse policy
-        policy = Policy(**data)
+        policy = Policy.model_validate(data)
         
         return {
             'valid': True,
@@ -220,9 +304,10 @@ async def validate_file(data: Dict[str, Any]) -> Dict[str, Any]:
 
 
 @router.post("/explain")
-async def explain(data: Dict[str, Any]) -> Dict[str, Any]:
+async def explain(request: Request) -> Dict[str, Any]:
     """Explain what validators would trigger for a tool call"""
     try:
+        data = await _json_body(request)
         if not data:
             raise HTTPException(status_code=400, detail={'error': 'No data provided'})
         
@@ -233,7 +318,7 @@ async def explain(data: Dict[str, Any]) -> Dict[str, Any]:
             raise HTTPException(status_code=400, detail={'error': 'tool is required'})
         
         # Load merged policy
-        policy = load_merged_policy()
+        policy = _load_merged_policy_cached()
         
         # Create context
         context = ContextV1(
@@ -242,27 +327,32 @@ async def explain(data: Dict[str, Any]) -> Dict[str, Any]:
             metadata={}
         )
         
-        # Run validation
-        registry = auto_register()
-        engine = ValidationEngine(registry=registry, policy=policy)
+        # Run validation (no await between setting the policy and evaluating,
+        # so concurrent requests on the event loop can't interleave here)
+        engine = _get_explain_engine()
+        engine.policy = policy
         decisions = engine.evaluate(context)
         
-        # Format results
+        # Format results and calculate summary in one pass
         results = []
+        blocked = warned = shadowed = 0
         for decision in decisions:
+            enforcement = decision.enforcement
             results.append({
                 'code': decision.code,
                 'message': decision.message,
                 'validator_id': decision.validator_id,
-                'enforcement': decision.enforcement,
+                'enforcement': enforcement,
                 'allowed': decision.allowed,
                 'evidence': decision.evidence
             })
-        
-        # Calculate summary
-        blocked = sum(1 for d in decisions if d.enforcement == "BLOCK" and not d.allowed)
-        warned = sum(1 for d in decisions if d.enforcement == "WARN")
-        shadowed = sum(1 for d in decisions if d.enforcement == "SHADOW")
+            if enforcement == "BLOCK":
+                if not decision.allowed:
+                    blocked += 1
+            elif enforcement == "WARN":
+                warned += 1
+            elif enforcement == "SHADOW":
+                shadowed += 1
         
         return {
             'tool': tool,
@@ -286,9 +376,15 @@ async def explain(data: Dict[str, Any]) -> Dict[str, Any]:
 
 
 @router.post("/diff")
-async def diff_policies(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Compare two policies"""
+async def diff_policies(request: Request, validate: bool = True) -> Dict[str, Any]:
+    """
+    Compare two policies
+    
+    With validate=false the raw "validators" mappings are compared as given,
+    skipping Policy parsing (no defaults filled in, no schema errors).
+    """
     try:
+        data = await _json_body(request)
         if not data:
             raise HTTPException(status_code=400, detail={'error': 'No data provided'})
         
@@ -300,32 +396,37 @@ async def diff_policies(data: Dict[str, Any]) -> Dict[str, Any]:
                 'error': 'Both policy1 and policy2 are required'
             })
         
-        policy1 = Policy(**policy1_data)
-        policy2 = Policy(**policy2_data)
+        if validate:
+            validators1 = Policy.model_validate(policy1_data).validators
+            validators2 = Policy.model_validate(policy2_data).validators
+        else:
+            validators1 = policy1_data.get('validators') or {}
+            validators2 = policy2_data.get('validators') or {}
         
         # Compare validators
-        validators1 = set(policy1.validators.keys())
-        validators2 = set(policy2.validators.keys())
-        
-        added = list(validators2 - validators1)
-        removed = list(validators1 - validators2)
-        common = validators1 & validators2
+        added = list(validators2.keys() - validators1.keys())
+        removed = list(validators1.keys() - validators2.keys())
         
-        # Check modified validators
+        # Split common validators into modified / unchanged in one pass
         modified = []
-        for vid in common:
-            if policy1.validators[vid] != policy2.validators[vid]:
+        unchanged = []
+        for vid in validators1.keys() & validators2.keys():
+            before = validators1[vid]
+            after = validators2[vid]
+            if before != after:
                 modified.append({
                     'id': vid,
-                    'before': policy1.validators[vid],
-                    'after': policy2.validators[vid]
+                    'before': before,
+                    'after': after
                 })
+            else:
+                unchanged.append(vid)
         
         return {
             'added': added,
             'removed': removed,
             'modified': modified,
-            'unchanged': list(common - {m['id'] for m in modified})
+            'unchanged': unchanged
         }
         
     except HTTPException:
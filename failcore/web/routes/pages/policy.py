@@ -12,6 +12,13 @@ from ....core.validate.loader import get_policy_dir
 TEMPLATES_DIR = Path(__file__).parent.parent.parent / "templates"
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
+# Resolved once at import; skips the per-request loader lookup and reload stat
+_TPL_OVERVIEW = templates.get_template("policy/overview.html")
+_TPL_VALIDATORS = templates.get_template("policy/validators.html")
+_TPL_EDITOR = templates.get_template("policy/editor.html")
+_TPL_EXPLAIN = templates.get_template("policy/explain.html")
+_TPL_DIFF = templates.get_template("policy/diff.html")
+
 router = APIRouter()
 
 
@@ -25,23 +32,17 @@ async def policy_overview(request: Request):
         policy_dir = None
         policy_exists = False
     
-    return templates.TemplateResponse(
-        "policy/overview.html",
-        {
-            "request": request,
-            "policy_dir": str(policy_dir) if policy_dir else None,
-            "policy_exists": policy_exists
-        }
-    )
+    return HTMLResponse(_TPL_OVERVIEW.render(
+        request=request,
+        policy_dir=str(policy_dir) if policy_dir else None,
+        policy_exists=policy_exists,
+    ))
 
 
 @router.get("/policy/validators", response_class=HTMLResponse)
 async def validators_list(request: Request):
     """List all available validators"""
-    return templates.TemplateResponse(
-        "policy/validators.html",
-        {"request": request}
-    )
+    return HTMLResponse(_TPL_VALIDATORS.render(request=request))
 
 
 @router.get("/policy/editor/{policy_type}", response_class=HTMLResponse)
@@ -50,28 +51,16 @@ async def policy_editor(request: Request, policy_type: str):
     if policy_type not in ['active', 'shadow', 'breakglass', 'merged']:
         return HTMLResponse("Invalid policy type", status_code=400)
     
-    return templates.TemplateResponse(
-        "policy/editor.html",
-        {
-            "request": request,
-            "policy_type": policy_type
-        }
-    )
+    return HTMLResponse(_TPL_EDITOR.render(request=request, policy_type=policy_type))
 
 
 @router.get("/policy/explain", response_class=HTMLResponse)
 async def policy_explain(request: Request):
     """Policy explain tool"""
-    return templates.TemplateResponse(
-        "policy/explain.html",
-        {"request": request}
-    )
+    return HTMLResponse(_TPL_EXPLAIN.render(request=request))
 
 
 @router.get("/policy/diff", response_class=HTMLResponse)
 async def policy_diff(request: Request):
     """Policy diff tool"""
-    return templates.TemplateResponse(
-        "policy/diff.html",
-        {"request": request}
-    )
+    return HTMLResponse(_TPL_DIFF.render(request=request))
@@ -0,0 +1,132 @@
+# tests/test_trace_ingest.py
+"""
+TraceIngestor -> SQLiteStore round trips with step events
+"""
+
+import json
+
+import pytest
+
+from failcore.infra.storage.ingest import TraceIngestor
+from failcore.infra.storage.trace import SQLiteStore
+
+
+RUN = {"run_id": "run_1", "created_at": "2026-01-01T00:00:00Z", "workspace": "ws"}
+
+
+def _event(seq, etype, step_id, data=None, tool="read_file"):
+    return {
+        "schema": "failcore.trace.v0.1.3",
+        "seq": seq,
+        "ts": f"2026-01-01T00:00:{seq:02d}Z",
+        "run": RUN,
+        "event": {
+            "type": etype,
+            "step": {"id": step_id, "tool": tool, "attempt": 1, "fingerprint": {"id": f"fp_{step_id}"}},
+            "data": data or {},
+        },
+    }
+
+
+def _write_trace(path, events):
+    path.write_text("\n".join(json.dumps(e) for e in events) + "\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = SQLiteStore(str(tmp_path / "failcore.db"))
+    s.connect()
+    s.init_schema()
+    yield s
+    s.close()
+
+
+def _trace_with_steps(tmp_path):
+    return _write_trace(tmp_path / "trace.jsonl", [
+        _event(1, "STEP_START", "s1"),
+        _event(2, "OUTPUT_NORMALIZED", "s1", {"normalize": {"decision": "mismatch"}}),
+        _event(3, "STEP_END", "s1", {"result": {"status": "OK", "phase": "execute", "duration_ms": 5}}),
+        _event(4, "STEP_START", "s2", tool="write_file"),
+        _event(5, "POLICY_DENIED", "s2", tool="write_file"),
+        _event(6, "STEP_END", "s2", {"result": {
+            "status": "BLOCKED", "phase": "policy", "duration_ms": 1,
+            "error": {"code": "PATH_DENIED", "message": "outside sandbox"},
+        }}, tool="write_file"),
+        _event(7, "STEP_START", "s3"),
+    ])
+
+
+@pytest.mark.parametrize("flush_after", [None, 1])
+def test_ingest_writes_steps(store, tmp_path, monkeypatch, flush_after):
+    # Complete rows must take the batched upsert, not the per-step fallback
+    def no_fallback(step_data):
+        raise AssertionError("per-step fallback used")
+    monkeypatch.setattr(store, "_update_or_insert_step", no_fallback)
+
+    stats = TraceIngestor(store).ingest_file(_trace_with_steps(tmp_path), flush_after=flush_after)
+
+    assert stats["events"] == 7
+    assert stats["errors"] == 0
+    assert stats["steps"] == 3
+    assert stats["incomplete"] == 1
+
+    rows = {r["step_id"]: dict(r) for r in store.conn.execute("SELECT * FROM steps")}
+    assert set(rows) == {"s1", "s2", "s3"}
+
+    s1 = rows["s1"]
+    assert (s1["name"], s1["kind"], s1["status"]) == ("read_file", "tool", "OK")
+    assert (s1["start_seq"], s1["end_seq"]) == (1, 3)
+    assert s1["started_at"] == "2026-01-01T00:00:01Z"
+    assert s1["finished_at"] == "2026-01-01T00:00:03Z"
+    assert s1["fingerprint"] == "fp_s1"
+    payload = json.loads(s1["payload_json"])
+    assert payload["phase"] == "execute"
+    assert payload["warnings"] == ["OUTPUT_KIND_MISMATCH"]
+    assert payload["has_output_normalized"] == 1
+
+    s2 = rows["s2"]
+    assert (s2["name"], s2["status"], s2["error_code"]) == ("write_file", "BLOCKED", "PATH_DENIED")
+    assert json.loads(s2["payload_json"])["has_policy_denied"] == 1
+
+    assert rows["s3"]["status"] == "INCOMPLETE"
+
+    run = store.conn.execute("SELECT total_events, total_steps FROM runs WHERE run_id = 'run_1'").fetchone()
+    assert tuple(run) == (7, 3)
+
+
+def test_ingest_reingest_updates_steps(store, tmp_path):
+    trace = _trace_with_steps(tmp_path)
+    TraceIngestor(store).ingest_file(trace)
+    TraceIngestor(store).ingest_file(trace)
+
+    assert store.conn.execute("SELECT COUNT(*) FROM steps").fetchone()[0] == 3
+
+
+def test_ingest_counts_unbindable_event_as_error(store, tmp_path):
+    bad = _event(2, "LOG", "s1")
+    bad["ts"] = {"not": "bindable"}
+    trace = _write_trace(tmp_path / "trace.jsonl", [_event(1, "LOG", "s1"), bad, _event(3, "LOG", "s1")])
+
+    stats = TraceIngestor(store).ingest_file(trace)
+
+    assert (stats["events"], stats["errors"]) == (2, 1)
+    assert store.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 2
+    assert not store.conn.in_transaction
+
+
+def test_ingest_restores_connection_pragmas(store, tmp_path):
+    cache_size = store.conn.execute("PRAGMA cache_size").fetchone()[0]
+    ingestor = TraceIngestor(store)
+    assert store.conn.execute("PRAGMA cache_size").fetchone()[0] == cache_size
+
+    ingestor.ingest_file(_trace_with_steps(tmp_path))
+    assert store.conn.execute("PRAGMA cache_size").fetchone()[0] == cache_size
+
+
+def test_insert_events_keeps_nonfinite_floats(store):
+    event = _event(1, "LOG", "s1", {"metrics": {"score": float("nan"), "limits": [float("inf")]}})
+    store.insert_events([event])
+
+    payload = store.conn.execute("SELECT payload_json FROM events").fetchone()[0]
+    assert payload == json.dumps(event)